@@ -8,12 +8,22 @@ Usage:
     python pbi_pipeline.py "report.pbix"
     python pbi_pipeline.py --report-root "data/X.Report/definition" --model-root "data/X.SemanticModel/definition"
     python pbi_pipeline.py "Revenue Opportunities"
+    python pbi_pipeline.py --batch "reports/*.pbix"
 """
 
 import argparse
+import contextlib
+import dataclasses
+import functools
+import glob
+import hashlib
+import io
 import os
+import pickle
 import re
 import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Windows console encoding fix
 os.environ.setdefault("PYTHONIOENCODING", "utf-8")
@@ -21,23 +31,47 @@ os.environ.setdefault("PYTHONIOENCODING", "utf-8")
 # Add skills/ to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "skills"))
 
-from extract_metadata import extract_metadata, export_to_excel
-from dax_query_builder import read_extractor_output, build_bookmark_queries, write_output
-from tmdl_parser import parse_semantic_model
+# Skill modules (pandas, openpyxl, TMDL parser) are imported lazily inside main()
+# so `--help` and argument errors don't pay their import cost.
+
+# Any character that is not a word char or hyphen — replaced with '_' in output filenames
+_SANITIZE_RE = re.compile(r'[^\w\-]')
+
+# PBIP folder tails appended to data/<name> — built once instead of per os.path.join call
+_REPORT_DEF_SUFFIX = ".Report" + os.sep + "definition"
+_MODEL_DEF_SUFFIX = ".SemanticModel" + os.sep + "definition"
 
 
 def sanitize_filename(name: str) -> str:
     """Sanitize a report name for use as a filename."""
-    return re.sub(r'[^\w\-]', '_', name)
+    return _SANITIZE_RE.sub('_', name)
+
+
+@functools.lru_cache(maxsize=8)
+def _scan_data_dir(data_dir: str, mtime_ns: int) -> dict:
+    """Index the report folders in data_dir as {lowercased base name: base name}.
+
+    mtime_ns is only part of the cache key — adding or removing a report
+    folder bumps the directory mtime, which invalidates the cached listing.
+    """
+    reports = {}
+    with os.scandir(data_dir) as entries:
+        for entry in entries:
+            # DirEntry.is_dir() uses the type from the directory scan — no extra stat()
+            if entry.name.endswith(".Report") and entry.is_dir():
+                base = entry.name[:-len(".Report")]
+                reports[base.lower()] = base
+    return reports
 
 
 def resolve_sample_report(name: str, data_dir: str) -> tuple:
     """Resolve a sample report name to report_root and model_root paths.
 
-    Tries exact match first, then case-insensitive prefix match.
+    Tries shortcut names first, then exact (case-insensitive) match, then
+    case-insensitive prefix match.
 
     Returns:
-        (report_root, model_root) paths or raises FileNotFoundError
+        (report_root, model_root, resolved_name) or raises FileNotFoundError
     """
     # Map of known shortcut names → actual directory names
     shortcuts = {
@@ -52,123 +86,157 @@ def resolve_sample_report(name: str, data_dir: str) -> tuple:
         "data dump": "Data Dump 05152025 - Use As Sample",
     }
 
-    # Try shortcut lookup first
-    resolved = shortcuts.get(name.lower())
-    if resolved:
-        report_root = os.path.join(data_dir, f"{resolved}.Report", "definition")
-        model_root = os.path.join(data_dir, f"{resolved}.SemanticModel", "definition")
-        if os.path.isdir(report_root):
-            return report_root, model_root, resolved
-
-    # Try exact name
-    report_root = os.path.join(data_dir, f"{name}.Report", "definition")
-    model_root = os.path.join(data_dir, f"{name}.SemanticModel", "definition")
-    if os.path.isdir(report_root):
-        return report_root, model_root, name
-
-    # Try case-insensitive scan of data_dir
+    reports = _scan_data_dir(data_dir, os.stat(data_dir).st_mtime_ns)
     name_lower = name.lower()
-    for entry in os.listdir(data_dir):
-        if entry.lower().startswith(name_lower) and entry.endswith(".Report"):
-            base = entry[:-len(".Report")]
-            report_root = os.path.join(data_dir, entry, "definition")
-            model_root = os.path.join(data_dir, f"{base}.SemanticModel", "definition")
-            if os.path.isdir(report_root):
-                return report_root, model_root, base
+
+    # Candidates in priority order: shortcut → exact name → prefix match
+    candidates = [
+        reports.get(shortcuts.get(name_lower, "").lower()),
+        reports.get(name_lower),
+    ]
+    candidates.extend(base for key, base in reports.items() if key.startswith(name_lower))
+
+    for base in candidates:
+        if not base:
+            continue
+        base_path = os.path.join(data_dir, base)
+        report_root = base_path + _REPORT_DEF_SUFFIX
+        model_root = base_path + _MODEL_DEF_SUFFIX
+        if os.path.isdir(report_root):
+            return report_root, model_root, base
 
     raise FileNotFoundError(
         f"Could not find sample report '{name}' in {data_dir}. "
-        f"Available reports: {[d for d in os.listdir(data_dir) if d.endswith('.Report')]}"
+        f"Available reports: {[f'{base}.Report' for base in reports.values()]}"
     )
 
 
-def main():
-    parser = argparse.ArgumentParser(
-        description="PBI DAX Query Generation Pipeline — unified CLI",
-        epilog="Examples:\n"
-               '  python pbi_pipeline.py "Revenue Opportunities"\n'
-               '  python pbi_pipeline.py "report.pbix"\n'
-               '  python pbi_pipeline.py --report-root "data/X.Report/definition" '
-               '--model-root "data/X.SemanticModel/definition"',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    parser.add_argument(
-        "input", nargs="?", default=None,
-        help="Path to .pbix file OR sample report name (e.g., 'Revenue Opportunities')",
-    )
-    parser.add_argument("--report-root", help="Path to PBIP report definition root")
-    parser.add_argument("--model-root", help="Path to PBIP semantic model definition root")
-    parser.add_argument("--output-dir", default="output", help="Output directory (default: output/)")
-    parser.add_argument("--no-bookmarks", action="store_true", help="Skip bookmark extraction")
+def _tree_fingerprint(root: str) -> list:
+    """Sorted (relpath, size, mtime_ns) for every file under root.
 
-    args = parser.parse_args()
+    Changes when any file is edited, added, deleted or renamed — a newest-mtime
+    check alone misses deletions and renames.
+    """
+    entries = []
+    for dirpath, _, filenames in os.walk(root):
+        for filename in filenames:
+            path = os.path.join(dirpath, filename)
+            st = os.stat(path)
+            entries.append((os.path.relpath(path, root), st.st_size, st.st_mtime_ns))
+    entries.sort()
+    return entries
+
+
+def load_semantic_model(model_root: str, cache_dir: str = None):
+    """Parse a semantic model, reusing a pickled copy from cache_dir when fresh.
+
+    The cache file is keyed by the absolute model_root path, the
+    SemanticModel field layout and the tmdl_parser source (size + mtime), so
+    parser changes never load an old pickle. It stores a fingerprint of every
+    file under model_root (TMDL tables plus the .source / relationships
+    markers written by pbix_extractor) and is fresh only while that listing
+    is unchanged.
+
+    Args:
+        model_root: Path to semantic model definition root (contains tables/).
+        cache_dir: Directory for cached models. None disables the cache.
 
-    # Validate inputs
-    if not args.input and not (args.report_root and args.model_root):
-        parser.error("Provide either a .pbix file / sample name, or both --report-root and --model-root")
+    Returns:
+        SemanticModel
+    """
+    import tmdl_parser
+    from tmdl_parser import SemanticModel, parse_semantic_model
+
+    if not cache_dir:
+        return parse_semantic_model(model_root)
+
+    # Field names and the parser source stamp are part of the key so neither a
+    # SemanticModel layout change nor a parse-logic change loads a stale pickle
+    schema = ",".join(f.name for f in dataclasses.fields(SemanticModel))
+    parser_stat = os.stat(tmdl_parser.__file__)
+    parser_stamp = f"{parser_stat.st_size}:{parser_stat.st_mtime_ns}"
+    key = hashlib.md5(
+        f"{os.path.abspath(model_root)}|{schema}|{parser_stamp}".encode("utf-8")
+    ).hexdigest()
+    cache_path = os.path.join(cache_dir, f"{key}.pkl")
+    fingerprint = _tree_fingerprint(model_root)
+
+    if os.path.isfile(cache_path):
+        try:
+            with open(cache_path, "rb") as f:
+                cached = pickle.load(f)
+            if isinstance(cached, dict) and cached.get("fingerprint") == fingerprint:
+                return cached["model"]
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError) as e:
+            print(f"    WARNING: Ignoring unreadable model cache {cache_path}: {e}")
+
+    model = parse_semantic_model(model_root)
+    tmp_path = None
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file and rename it into place, so an interrupted run
+        # or a concurrent --batch worker never leaves a partial pickle behind
+        with tempfile.NamedTemporaryFile(dir=cache_dir, suffix=".tmp", delete=False) as f:
+            tmp_path = f.name
+            pickle.dump({"fingerprint": fingerprint, "model": model}, f, protocol=5)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        print(f"    WARNING: Could not write model cache {cache_path}: {e}")
+        if tmp_path and os.path.exists(tmp_path):
+            os.unlink(tmp_path)
+    return model
+
+
+def _resolve_input(input_name: str, data_dir: str, model_root: str = None) -> tuple:
+    """Resolve a .pbix path or sample report name to pipeline inputs.
+
+    .pbix files are extracted first (Skill 0) into data_dir.
 
-    project_root = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(project_root, "data")
-    output_dir = os.path.join(project_root, args.output_dir)
-    os.makedirs(output_dir, exist_ok=True)
+    Returns:
+        (report_root, model_root, report_name, semantic_model_source)
+        or raises FileNotFoundError
+    """
+    if not input_name.lower().endswith(".pbix"):
+        report_root, model_root, report_name = resolve_sample_report(input_name, data_dir)
+        print(f"Mode: Sample report — {report_name}")
+        return report_root, model_root, report_name, ""
 
-    report_root = None
-    model_root = None
-    report_name = None
-    semantic_model_source = ""  # Track model provenance through the pipeline
+    # .pbix file — run Skill 0 first
+    if not os.path.isfile(input_name):
+        raise FileNotFoundError(f"PBIX file not found: {input_name}")
 
-    # --- Mode detection ---
-    if args.report_root and args.model_root:
-        # Explicit PBIP paths — source auto-detected from .source marker by parse_semantic_model()
-        report_root = args.report_root
-        model_root = args.model_root
-        # Derive name from report root path
-        report_name = os.path.basename(os.path.dirname(os.path.dirname(report_root)))
-        if report_name.endswith(".Report"):
-            report_name = report_name[:-len(".Report")]
-        print(f"Mode: Explicit PBIP paths")
+    print("=" * 60)
+    print("[0] Extracting .pbix file...")
+    print("=" * 60)
 
-    elif args.input and args.input.lower().endswith(".pbix"):
-        # .pbix file — run Skill 0 first
-        pbix_path = args.input
-        if not os.path.isfile(pbix_path):
-            print(f"ERROR: PBIX file not found: {pbix_path}")
-            sys.exit(1)
+    from pbix_extractor import extract_pbix
+    result = extract_pbix(input_name, output_dir=data_dir, model_root=model_root)
 
-        print("=" * 60)
-        print("[0] Extracting .pbix file...")
-        print("=" * 60)
+    print(f"\n    Extracted: {result.report_name}")
+    print(f"    Pages: {result.page_count}, Data visuals: {result.data_visual_count}, "
+          f"Bookmarks: {result.bookmark_count}")
+    print(f"    Semantic model: {result.semantic_model_source}")
 
-        from pbix_extractor import extract_pbix
-        result = extract_pbix(pbix_path, output_dir=data_dir, model_root=args.model_root)
-        report_root = result.report_root
-        model_root = result.model_root
-        report_name = result.report_name
-        semantic_model_source = result.semantic_model_source
+    if not result.model_root:
+        print("\n    WARNING: No semantic model available. Measure formulas will be missing.")
+        print("    Install pbixray (`pip install pbixray`) or provide --model-root.")
 
-        print(f"\n    Extracted: {report_name}")
-        print(f"    Pages: {result.page_count}, Data visuals: {result.data_visual_count}, "
-              f"Bookmarks: {result.bookmark_count}")
-        print(f"    Semantic model: {result.semantic_model_source}")
+    return (result.report_root, result.model_root, result.report_name,
+            result.semantic_model_source)
 
-        if not model_root:
-            print("\n    WARNING: No semantic model available. Measure formulas will be missing.")
-            print("    Install pbixray (`pip install pbixray`) or provide --model-root.")
 
-    else:
-        # Sample report name
-        name = args.input
-        try:
-            report_root, model_root, report_name = resolve_sample_report(name, data_dir)
-        except FileNotFoundError as e:
-            print(f"ERROR: {e}")
-            sys.exit(1)
-        print(f"Mode: Sample report — {report_name}")
+def run_pipeline(report_root: str, model_root: str, report_name: str, output_dir: str,
+                 include_bookmarks: bool = True, semantic_model_source: str = "",
+                 model_cache_dir: str = None) -> dict:
+    """Run metadata extraction (Skill 1) and DAX query generation (Skill 2) for one report.
 
+    Returns:
+        Summary dict with report_name, visual_count, metadata_path, dax_path
+        and bookmark_query_count, or raises FileNotFoundError if report_root is missing.
+    """
     # Check paths exist
     if not os.path.isdir(report_root):
-        print(f"ERROR: Report root not found: {report_root}")
-        sys.exit(1)
+        raise FileNotFoundError(f"Report root not found: {report_root}")
     if model_root and not os.path.isdir(model_root):
         print(f"WARNING: Model root not found: {model_root} — proceeding without semantic model")
         model_root = report_root  # fallback (extract_metadata handles missing tables/)
@@ -182,10 +250,20 @@ def main():
     print("[1] Extracting metadata...")
     print("=" * 60)
 
-    include_bookmarks = not args.no_bookmarks
+    from extract_metadata import extract_metadata, export_to_excel
+
+    # Parse the semantic model once — shared by Step 1 and Step 2's filter redundancy checks
+    model = None
+    if model_root:
+        try:
+            model = load_semantic_model(model_root, model_cache_dir)
+        except (OSError, ValueError) as e:  # unreadable / undecodable TMDL files
+            # extract_metadata() parses again itself; Step 2 works without a model
+            print(f"    WARNING: Could not load semantic model {model_root}: {e}")
+
     df, bookmarks_list, filter_expressions = extract_metadata(
         report_root, model_root, include_bookmarks=include_bookmarks,
-        semantic_model_source=semantic_model_source,
+        semantic_model_source=semantic_model_source, model=model,
     )
     export_to_excel(df, metadata_path, bookmarks_list=bookmarks_list,
                     filter_expressions=filter_expressions)
@@ -201,15 +279,9 @@ def main():
     print("[2] Generating DAX queries...")
     print("=" * 60)
 
-    visuals, page_filters, bookmarks, filter_expr_data = read_extractor_output(metadata_path)
+    from dax_query_builder import read_extractor_output, build_bookmark_queries, write_output
 
-    # Load semantic model for filter redundancy checks
-    model = None
-    if model_root:
-        try:
-            model = parse_semantic_model(model_root)
-        except Exception:
-            pass  # Non-critical — queries still generated without formula checks
+    visuals, page_filters, bookmarks, filter_expr_data = read_extractor_output(metadata_path)
 
     # Build bookmark queries if bookmarks present
     bookmark_queries = None
@@ -226,18 +298,200 @@ def main():
     if bm_query_count:
         print(f"    Bookmark DAX queries: {bm_query_count}")
 
-    # --- Summary ---
+    return {
+        "report_name": report_name,
+        "visual_count": visual_count,
+        "metadata_path": metadata_path,
+        "dax_path": dax_path,
+        "bookmark_query_count": bm_query_count,
+    }
+
+
+def _print_summary(summary: dict):
+    """Print the end-of-run summary for one report."""
     print("\n" + "=" * 60)
     print("Pipeline complete!")
     print("=" * 60)
-    print(f"  Report:     {report_name}")
-    print(f"  Visuals:    {visual_count}")
-    print(f"  Metadata:   {metadata_path}")
-    print(f"  DAX:        {dax_path}")
-    if bm_query_count:
-        print(f"  Bookmarks:  {bm_query_count} bookmark×visual queries")
+    print(f"  Report:     {summary['report_name']}")
+    print(f"  Visuals:    {summary['visual_count']}")
+    print(f"  Metadata:   {summary['metadata_path']}")
+    print(f"  DAX:        {summary['dax_path']}")
+    if summary["bookmark_query_count"]:
+        print(f"  Bookmarks:  {summary['bookmark_query_count']} bookmark×visual queries")
     print()
 
 
+def _run_one_report(input_name: str, data_dir: str, output_dir: str,
+                    include_bookmarks: bool, model_cache_dir: str) -> tuple:
+    """Batch worker: resolve one .pbix / sample report and run the full pipeline on it.
+
+    The worker's printed progress is captured rather than written straight to
+    the shared console, so the parent can print each report's log in one piece.
+
+    Returns:
+        (summary dict or None, captured output, error message or None)
+    """
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        try:
+            report_root, model_root, report_name, semantic_model_source = _resolve_input(
+                input_name, data_dir,
+            )
+            summary = run_pipeline(report_root, model_root, report_name, output_dir,
+                                   include_bookmarks=include_bookmarks,
+                                   semantic_model_source=semantic_model_source,
+                                   model_cache_dir=model_cache_dir)
+        except Exception as e:
+            return None, log.getvalue(), str(e)
+    return summary, log.getvalue(), None
+
+
+def _duplicate_report_names(paths: list) -> dict:
+    """Group .pbix paths whose reports would share extract and output files.
+
+    Extraction writes data/<stem>.Report and the outputs are named after
+    sanitize_filename(stem), so two paths collide when their sanitized stems
+    match (case-insensitively, for Windows/macOS file systems).
+
+    Returns:
+        {sanitized stem: [paths]} for every name used by more than one path
+    """
+    by_name = {}
+    for path in paths:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        by_name.setdefault(sanitize_filename(stem).lower(), []).append(path)
+    return {name: group for name, group in by_name.items() if len(group) > 1}
+
+
+def _run_batch(pattern: str, data_dir: str, output_dir: str,
+               include_bookmarks: bool, model_cache_dir: str) -> int:
+    """Run the pipeline for every .pbix matching pattern, one worker process per report.
+
+    Reports are independent, so they fan out across CPU cores (processes, not
+    threads — pandas/openpyxl hold the GIL for most of the Excel work).
+
+    Returns:
+        Number of reports that failed.
+    """
+    if os.path.isdir(pattern):
+        pattern = os.path.join(pattern, "*.pbix")
+    paths = sorted(glob.glob(pattern))
+    if not paths:
+        print(f"ERROR: No .pbix files match: {pattern}")
+        return 1
+
+    duplicates = _duplicate_report_names(paths)
+    if duplicates:
+        print("ERROR: These reports would extract to and write the same files; "
+              "rename them or run them separately:")
+        for group in duplicates.values():
+            print(f"  {', '.join(group)}")
+        return len(paths)
+
+    print(f"Mode: Batch — {len(paths)} report(s)")
+    failures = 0
+    max_workers = min(len(paths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_run_one_report, path, data_dir, output_dir,
+                            include_bookmarks, model_cache_dir): path
+            for path in paths
+        }
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                summary, log, error = future.result()
+            except Exception as e:  # the worker process itself died
+                summary, log, error = None, "", str(e)
+            print(log, end="")
+            if error is None:
+                _print_summary(summary)
+            else:
+                failures += 1
+                print(f"ERROR: {os.path.basename(path)}: {error}")
+
+    print(f"Batch complete: {len(paths) - failures}/{len(paths)} report(s) succeeded")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="PBI DAX Query Generation Pipeline — unified CLI",
+        epilog="Examples:\n"
+               '  python pbi_pipeline.py "Revenue Opportunities"\n'
+               '  python pbi_pipeline.py "report.pbix"\n'
+               '  python pbi_pipeline.py --batch "reports/*.pbix"\n'
+               '  python pbi_pipeline.py --report-root "data/X.Report/definition" '
+               '--model-root "data/X.SemanticModel/definition"',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument(
+        "input", nargs="?", default=None,
+        help="Path to .pbix file OR sample report name (e.g., 'Revenue Opportunities')",
+    )
+    parser.add_argument("--report-root", help="Path to PBIP report definition root")
+    parser.add_argument("--model-root", help="Path to PBIP semantic model definition root")
+    parser.add_argument("--output-dir", default="output", help="Output directory (default: output/)")
+    parser.add_argument("--no-bookmarks", action="store_true", help="Skip bookmark extraction")
+    parser.add_argument("--no-model-cache", action="store_true",
+                        help="Always re-parse the semantic model (ignore <output-dir>/.model_cache)")
+    parser.add_argument("--batch",
+                        help="Glob pattern (or directory) of .pbix files to process in parallel")
+
+    args = parser.parse_args()
+
+    # Validate inputs
+    if not args.batch and not args.input and not (args.report_root and args.model_root):
+        parser.error("Provide either a .pbix file / sample name, --batch, "
+                     "or both --report-root and --model-root")
+
+    project_root = os.path.dirname(os.path.abspath(__file__))
+    data_dir = os.path.join(project_root, "data")
+    output_dir = os.path.join(project_root, args.output_dir)
+    os.makedirs(output_dir, exist_ok=True)
+
+    include_bookmarks = not args.no_bookmarks
+    model_cache_dir = None if args.no_model_cache else os.path.join(output_dir, ".model_cache")
+
+    if args.batch:
+        if args.input or args.report_root or args.model_root:
+            parser.error("--batch cannot be combined with an input, --report-root or --model-root")
+        failures = _run_batch(args.batch, data_dir, output_dir, include_bookmarks, model_cache_dir)
+        sys.exit(1 if failures else 0)
+
+    semantic_model_source = ""  # Track model provenance through the pipeline
+
+    # --- Mode detection ---
+    if args.report_root and args.model_root:
+        # Explicit PBIP paths — source auto-detected from .source marker by parse_semantic_model()
+        report_root = args.report_root
+        model_root = args.model_root
+        # Derive name from report root path
+        report_name = os.path.basename(os.path.dirname(os.path.dirname(report_root)))
+        if report_name.endswith(".Report"):
+            report_name = report_name[:-len(".Report")]
+        print(f"Mode: Explicit PBIP paths")
+    else:
+        # .pbix file or sample report name
+        try:
+            report_root, model_root, report_name, semantic_model_source = _resolve_input(
+                args.input, data_dir, model_root=args.model_root,
+            )
+        except FileNotFoundError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
+
+    try:
+        summary = run_pipeline(report_root, model_root, report_name, output_dir,
+                               include_bookmarks=include_bookmarks,
+                               semantic_model_source=semantic_model_source,
+                               model_cache_dir=model_cache_dir)
+    except FileNotFoundError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+
+    _print_summary(summary)
+
+
 if __name__ == "__main__":
     main()
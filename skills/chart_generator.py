@@ -20,41 +20,66 @@ Usage:
 """
 
 import argparse
+import atexit
+import hashlib
+import json
+import logging
 import os
 import re
 import sys
 import tempfile
-from dataclasses import dataclass, field
+import weakref
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import cycle, islice
 from pathlib import Path
+from types import MappingProxyType
+from typing import Callable, NamedTuple, Optional
 
-import pandas as pd
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+# pandas, plotly and pptx.chart.data are imported inside the functions that use
+# them — together they dominate import time, and VisualSpec / metadata parsing
+# don't need them. The pptx names below back module-level constants.
 
 from pptx import Presentation as _PptxFactory
 from pptx.presentation import Presentation as PptxPresentation  # actual class for isinstance
-from pptx.chart.data import CategoryChartData, XyChartData
 from pptx.util import Inches, Pt, Emu
 from pptx.enum.chart import XL_CHART_TYPE, XL_LEGEND_POSITION, XL_LABEL_POSITION
 from pptx.enum.text import PP_ALIGN
 from pptx.dml.color import RGBColor
 from lxml import etree
 
+# Per-chart progress (Generated / Skipping / Saved) is logged at DEBUG, so
+# callers rendering many charts stay quiet; main() attaches a handler to this
+# logger (not the root logger) for CLI runs.
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # CONSTANTS
 # =============================================================================
 
 # Power BI default color palette (10 accent colors)
-PBI_COLORS = [
+# Tuples, so they can be shared as-is; per-point color arrays (pie/donut/
+# funnel/treemap) come from pbi_colors(n), which repeats the palette past 10.
+PBI_COLORS = (
     "#118DFF", "#12239E", "#E66C37", "#6B007B", "#E044A7",
     "#744EC2", "#D9B300", "#D64550", "#197278", "#1AAB40",
-]
+)
 
 PBI_FONT = "Segoe UI"
 
+# Trace-level styling shared by every trace that uses it. Renderers pass these
+# straight into a trace that goes onto a figure (which copies it) — never
+# mutate them in place; merge into a new dict to vary a key.
+_LABEL_FONT = {"size": 9, "family": PBI_FONT}                       # data labels
+_LABEL_FONT_INSIDE = {"size": 9, "family": PBI_FONT, "color": "white"}
+_SLICE_FONT = {"size": 11, "family": PBI_FONT}                      # pie/donut/funnel
+_TABLE_HEADER_FONT = {"color": "white", "size": 11, "family": PBI_FONT}
+_TABLE_CELL_FONT = {"size": 10, "family": PBI_FONT, "color": "#333333"}
+_MARKER_TPL = {"size": 10}                                          # scatter points
+
 # PBI colors as RGBColor tuples for python-pptx native charts
-PBI_RGB_COLORS = [
+PBI_RGB_COLORS = (
     RGBColor(0x11, 0x8D, 0xFF),  # #118DFF
     RGBColor(0x12, 0x23, 0x9E),  # #12239E
     RGBColor(0xE6, 0x6C, 0x37),  # #E66C37
@@ -65,7 +90,20 @@ PBI_RGB_COLORS = [
     RGBColor(0xD6, 0x45, 0x50),  # #D64550
     RGBColor(0x19, 0x72, 0x78),  # #197278
     RGBColor(0x1A, 0xAB, 0x40),  # #1AAB40
-]
+)
+
+
+def pbi_color_cycle(colors=PBI_COLORS):
+    """Endless iterator over a PBI palette — zip it against series/points
+    instead of indexing with i % len(palette)."""
+    return cycle(colors)
+
+
+def pbi_colors(n, colors=PBI_COLORS):
+    """First n colors of a PBI palette, wrapping around — one color array for
+    a trace that colors per point (pie slices, funnel stages, treemap tiles).
+    Plotly does not cycle a short marker color array itself."""
+    return list(islice(cycle(colors), n))
 
 # Slide dimensions: 16:9 widescreen
 SLIDE_WIDTH = Inches(13.333)
@@ -106,21 +144,32 @@ PNG_FALLBACK_TYPES = {
     "waterfallChart", "funnelChart", "treemap", "gauge",
 }
 
+# Renderers build traces as plain dicts ({"type": "bar", ...}) and create the
+# figure once with go.Figure(data=traces, layout=...) — one figure-level pass
+# instead of a graph-object constructor plus an add_trace() per trace. Nested
+# properties are spelled as dicts ("marker": {"color": ...}), not marker_color.
+
+_RE_BRACKET_NAME = re.compile(r'\[([^\]]+)\]')   # Table[Column] -> Column
+_FNAME_SANITIZE_RE = re.compile(r'[^\w\-]')      # chars not allowed in output filenames
+
 
 # =============================================================================
 # DATA CLASS
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class VisualSpec:
-    """Metadata describing a single PBI visual for chart generation."""
+    """Metadata describing a single PBI visual for chart generation.
+
+    Immutable and hashable; the builders below pass the field lists as tuples.
+    """
     page_name: str
     visual_name: str
     visual_type: str                          # PBI camelCase identifier (e.g., "barChart")
-    grouping_columns: list = field(default_factory=list)  # X-axis / Matrix Rows field names
-    measure_columns: list = field(default_factory=list)   # Y-axis / Values field names
-    y2_columns: list = field(default_factory=list)        # secondary-axis measures (Y2-axis)
-    series_columns: list = field(default_factory=list)    # Legend / Series field names
+    grouping_columns: tuple = ()              # X-axis / Matrix Rows field names
+    measure_columns: tuple = ()               # Y-axis / Values field names
+    y2_columns: tuple = ()                    # secondary-axis measures (Y2-axis)
+    series_columns: tuple = ()                # Legend / Series field names
     facet_column: str = ""                    # Small Multiples field name (if present)
     dax_pattern: str = ""                     # informational (e.g., "Pattern 3")
 
@@ -142,7 +191,7 @@ def get_pbi_plotly_layout():
         "font": {"family": PBI_FONT, "size": 12, "color": "#333333"},
         "plot_bgcolor": "white",
         "paper_bgcolor": "white",
-        "colorway": PBI_COLORS,
+        "colorway": list(PBI_COLORS),
         "margin": {"l": 60, "r": 30, "t": 50, "b": 60},
         "xaxis": {
             "showgrid": False,
@@ -158,10 +207,124 @@ def get_pbi_plotly_layout():
     }
 
 
+# Built once at import for renderers that read individual keys; read-only view
+# so no renderer can change the theme for the ones after it.
+# get_pbi_plotly_layout() still returns a fresh, mutable dict for callers.
+_PBI_LAYOUT = MappingProxyType(get_pbi_plotly_layout())
+
+
+def _chart_layout(title, xaxis_title=None, yaxis_title=None, reverse_y=False, **layout):
+    """_PBI_LAYOUT merged with one chart's title, axis titles and layout keys.
+
+    Pass it as go.Figure(layout=...): the merged dict is validated once, about
+    twice as fast as copying a prebuilt go.Layout and then re-validating the
+    per-chart keys through update_layout()/update_yaxes(). A None axis title
+    leaves the axis untitled. Nested dicts are shared with _PBI_LAYOUT — hand
+    the result to plotly (which copies it), never mutate it.
+
+    Figures themselves are deliberately not pooled or reused: generate_chart()
+    returns them to the caller, so a recycled Figure would be cleared under
+    whoever still holds it. Building each one from this dict keeps it cheap.
+    """
+    merged = {**_PBI_LAYOUT, "title": {"text": title}, **layout}
+    xaxis = merged["xaxis"] = dict(_PBI_LAYOUT["xaxis"])
+    yaxis = merged["yaxis"] = dict(_PBI_LAYOUT["yaxis"])
+    if xaxis_title is not None:
+        xaxis["title"] = {"text": xaxis_title}
+    if yaxis_title is not None:
+        yaxis["title"] = {"text": yaxis_title}
+    if reverse_y:
+        yaxis["autorange"] = "reversed"
+    return merged
+
+
+@lru_cache(maxsize=None)
+def _combo_layout(secondary_y):
+    """Axis layout of make_subplots(specs=[[{"secondary_y": ...}]]), built once.
+
+    Combo charts pass it as go.Figure(layout=...) and name their axes on the
+    traces, so the subplot grid is only validated the first time.
+    """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
+    axes = make_subplots(specs=[[{"secondary_y": secondary_y}]]).layout.to_plotly_json()
+    # Leave the template out: go.Figure() applies the default one anyway, and
+    # copying an embedded template costs more than make_subplots itself
+    axes.pop("template", None)
+    return go.Layout(axes)
+
+
+@lru_cache(maxsize=None)
+def _card_domains(n_cards):
+    """(x, y) domains for n_cards side-by-side indicators, as make_subplots lays them out."""
+    from plotly.subplots import make_subplots
+
+    fig = make_subplots(rows=1, cols=n_cards, specs=[[{"type": "indicator"}] * n_cards])
+    return tuple(tuple(fig.get_subplot(1, col)) for col in range(1, n_cards + 1))
+
+
 # =============================================================================
 # DATA HELPERS
 # =============================================================================
 
+def _safe_float(value):
+    """float(value), with NaN / None / pd.NA read as 0 (blank measure cells)."""
+    try:
+        f = float(value)
+    except TypeError:
+        return 0
+    return 0 if f != f else f
+
+
+def _first_row_floats(df, cols):
+    """First-row values of cols as a list of floats, blanks read as 0.
+
+    One float64 conversion of the row instead of a pandas row Series plus a
+    _safe_float per label — the measures-only pie/donut slice values.
+    """
+    import numpy as np
+
+    arr = df[cols].head(1).to_numpy(dtype=np.float64, na_value=np.nan)[0]
+    return np.where(np.isnan(arr), 0.0, arr).tolist()
+
+
+def _first_row_as_dict(df, cols):
+    """{col: first-row value} for cols, read from one row of the cols block
+    rather than a df.iloc[0] Series over every column (card/KPI values)."""
+    return dict(zip(cols, df[cols].head(1).to_numpy()[0]))
+
+
+def _col_array(df, col, as_str=False):
+    """Column values as a NumPy array for handing straight to plotly.
+
+    Avoids boxing every value into a Python list first; plotly serializes
+    ndarrays directly. as_str=True stringifies (category labels); string-dtype
+    columns without missing values are already labels and skip the astype.
+    """
+    import pandas as pd
+
+    series = df[col]
+    if as_str and not (isinstance(series.dtype, pd.StringDtype) and not series.hasnans):
+        return series.astype(str).to_numpy()
+    return series.to_numpy()
+
+
+def _sorted_by(df, col, columns=None):
+    """df ordered by col, skipping the sort + copy when it is already in order.
+
+    DAX results usually come back grouped by the category column, so the
+    monotonic check (one pass, no copy) lets most renders skip sort_values.
+    The sort is stable so ties keep their query order either way. Pass the
+    columns the caller reads to sort just those instead of every column.
+    """
+    if df[col].is_monotonic_increasing:
+        return df
+    if columns is not None:
+        df = df[[col, *(c for c in columns if c != col)]]
+    return df.sort_values(col, kind="stable")
+
+
 def _bare_column_name(name):
     """Extract the bare column name from a DAX-style reference.
 
@@ -170,11 +333,104 @@ def _bare_column_name(name):
       - "'Category'[Channel]" -> "Channel"
       - "Channel"            -> "Channel"
     """
-    import re
-    m = re.search(r'\[([^\]]+)\]', name)
+    m = _RE_BRACKET_NAME.search(name)
     return m.group(1) if m else name
 
 
+# id(df) -> (weakref to df, memo dict). Per-frame lookups live here rather
+# than in df.attrs, which pandas copies into every derived frame and
+# serializes (to_parquet etc.). Entries drop when their frame is collected.
+_FRAME_MEMOS = {}
+
+
+def _frame_memo(df):
+    """Return the private memo dict for df, creating it on first use."""
+    key = id(df)
+    entry = _FRAME_MEMOS.get(key)
+    if entry is None or entry[0]() is not df:
+        def _drop(ref, key=key):
+            if _FRAME_MEMOS.get(key, (None,))[0] is ref:
+                del _FRAME_MEMOS[key]
+        entry = _FRAME_MEMOS[key] = (weakref.ref(df, _drop), {})
+    return entry[1]
+
+
+def _df_column_maps(df):
+    """Return (lower_map, bare_map) for looking up df columns by name.
+
+    lower_map is keyed by the lowercased/stripped column name, bare_map by the
+    lowercased bare bracket-extracted name. Both are memoized per frame (see
+    _frame_memo), keyed by the column labels, so repeated classify/resolve
+    calls against the same frame don't rebuild them.
+    """
+    cols = tuple(df.columns)
+    memo = _frame_memo(df)
+    cached = memo.get("cols_lower")
+    if cached is None or cached[0] != cols:
+        cached = memo["cols_lower"] = (
+            cols,
+            {c.lower().strip(): c for c in cols},
+            {_bare_column_name(c).lower().strip(): c for c in cols},
+        )
+    return cached[1], cached[2]
+
+
+def _find_df_column(df, name):
+    """Find the df column matching a spec field name (case-insensitive).
+
+    Tries the full name, then the bare bracketed name on either side
+    (e.g. "Category[Channel]" matches a "Channel" column and vice versa).
+    """
+    df_cols_lower, df_cols_bare = _df_column_maps(df)
+    key = name.lower().strip()
+    return (df_cols_lower.get(key)
+            or df_cols_bare.get(key)
+            or df_cols_lower.get(_bare_column_name(name).lower().strip()))
+
+
+def _split_combo_measures(df, spec, values):
+    """Split a combo chart's measures into (bar_measures, line_measures).
+
+    Measures named in spec.y2_columns (matched case-insensitively through the
+    frame's cached column map) go on the secondary axis as lines. Without y2
+    metadata, the last measure is the line and the rest are bars.
+    """
+    df_cols_lower = _df_column_maps(df)[0]
+    y2_actual = {df_cols_lower.get(y2.lower().strip()) for y2 in spec.y2_columns}
+    y2_actual.discard(None)
+    if y2_actual:
+        return ([v for v in values if v not in y2_actual],
+                [v for v in values if v in y2_actual])
+    if len(values) > 1:
+        return values[:-1], [values[-1]]
+    return values, []
+
+
+# Below this many rows, hashing a column into categories costs more than the
+# per-row string work it saves downstream
+_CATEGORICAL_MIN_ROWS = 1000
+
+
+def _categorize_groupings(df, spec):
+    """Return df with its string grouping/legend columns as pd.Categorical.
+
+    Renderers stringify, sort and group these columns; on a categorical that
+    work runs over the few distinct labels instead of every row. Small frames
+    (the usual DAX result) are returned untouched.
+    """
+    if len(df) < _CATEGORICAL_MIN_ROWS:
+        return df
+
+    import pandas as pd
+
+    cols = {}
+    for name in (*spec.grouping_columns, *spec.series_columns):
+        col = _find_df_column(df, name)
+        if col is not None and pd.api.types.is_string_dtype(df[col]):
+            cols[col] = "category"
+    return df.astype(cols) if cols else df
+
+
 def classify_columns(df, spec):
     """Split DataFrame columns into categories (grouping) and values (measures).
 
@@ -183,38 +439,49 @@ def classify_columns(df, spec):
     DAX-style column references (e.g. "Category[Channel]" -> "Channel").
     Falls back to dtype inference if no match.
 
+    Name-matched results are memoized per frame and field lists (validated
+    against the column labels, like _df_column_maps), so the table fallback
+    and repeated renders of one frame skip the matching. The dtype fallback
+    is not cached; it depends on dtypes, not just names.
+
     Returns:
         (categories: list[str], values: list[str]) — column names in df
     """
-    df_cols_lower = {c.lower().strip(): c for c in df.columns}
-    # Also build an index keyed by the bare bracket-extracted name
-    df_cols_bare = {_bare_column_name(c).lower().strip(): c for c in df.columns}
-
-    def _find_col(name):
-        key = name.lower().strip()
-        return (df_cols_lower.get(key)
-                or df_cols_bare.get(key)
-                or df_cols_lower.get(_bare_column_name(name).lower().strip()))
+    cols = tuple(df.columns)
+    key = (tuple(spec.grouping_columns), tuple(spec.measure_columns))
+    memo = _frame_memo(df)
+    cached = memo.get("classified")
+    if cached is None or cached[0] != cols:
+        cached = memo["classified"] = (cols, {})
+    hit = cached[1].get(key)
+    if hit is not None:
+        return list(hit[0]), list(hit[1])
 
     categories = []
     for gc in spec.grouping_columns:
-        actual = _find_col(gc)
+        actual = _find_df_column(df, gc)
         if actual and actual not in categories:
             categories.append(actual)
 
     values = []
     for mc in spec.measure_columns:
-        actual = _find_col(mc)
+        actual = _find_df_column(df, mc)
         if actual and actual not in values:
             values.append(actual)
 
+    if categories or values:
+        cached[1][key] = (tuple(categories), tuple(values))
+        return categories, values
+
     # Fallback: infer from data types if spec columns didn't match
-    if not categories and not values:
-        for col in df.columns:
-            if pd.api.types.is_numeric_dtype(df[col]):
-                values.append(col)
-            else:
-                categories.append(col)
+    from pandas.api.types import is_numeric_dtype
+
+    # One pass over df.dtypes — no per-column Series or select_dtypes frame
+    for col, dtype in df.dtypes.items():
+        if is_numeric_dtype(dtype):
+            values.append(col)
+        else:
+            categories.append(col)
 
     return categories, values
 
@@ -225,21 +492,12 @@ def _resolve_series(df, spec):
     Returns a list of matched column names (empty list if none found or spec has
     no series_columns). Used to pass explicit Legend/Series info to pivot helpers.
     """
-    series_cols = getattr(spec, "series_columns", [])
+    series_cols = getattr(spec, "series_columns", ())
     if not series_cols:
         return []
-    df_cols_lower = {c.lower().strip(): c for c in df.columns}
-    df_cols_bare = {_bare_column_name(c).lower().strip(): c for c in df.columns}
-
-    def _find(name):
-        key = name.lower().strip()
-        return (df_cols_lower.get(key)
-                or df_cols_bare.get(key)
-                or df_cols_lower.get(_bare_column_name(name).lower().strip()))
-
     resolved = []
     for sc in series_cols:
-        actual = _find(sc)
+        actual = _find_df_column(df, sc)
         if actual and actual not in resolved:
             resolved.append(actual)
     return resolved
@@ -258,6 +516,132 @@ def _sort_categories(labels):
     return labels
 
 
+# Row count from which _sum_pivot skips groupby/unstack for the bincount grid;
+# below it pandas' per-call overhead is noise.
+_FAST_PIVOT_MIN_ROWS = 50_000
+
+
+def _bincount_grid(index_keys, columns_keys, values):
+    """Sum values into a dense index x columns grid with one np.bincount.
+
+    Both keys are factorized (sorted, NaN keys dropped — groupby's defaults),
+    so each row maps to a single flat cell. NaN values count as 0, and integer
+    measures come back as int64, as groupby.sum() returns them.
+
+    Returns:
+        (grid: ndarray, index_uniques, columns_uniques)
+    """
+    import numpy as np
+    import pandas as pd
+
+    idx_codes, idx_uniques = pd.factorize(index_keys, sort=True)
+    col_codes, col_uniques = pd.factorize(columns_keys, sort=True)
+    n_rows, n_cols = len(idx_uniques), len(col_uniques)
+    keep = (idx_codes >= 0) & (col_codes >= 0)
+    cell = idx_codes[keep] * n_cols + col_codes[keep]
+    weights = np.nan_to_num(values.to_numpy(dtype="float64", na_value=np.nan)[keep])
+    grid = np.bincount(cell, weights=weights, minlength=n_rows * n_cols)
+    grid = grid.reshape(n_rows, n_cols)
+    if pd.api.types.is_integer_dtype(values):
+        grid = grid.astype("int64")
+    return grid, idx_uniques, col_uniques
+
+
+def _sum_pivot(df, index_col, columns_col, value_col):
+    """Sum value_col into an index_col x columns_col grid, missing cells as 0.
+
+    groupby + unstack(fill_value=0) gives the same sorted, zero-filled grid as
+    pivot_table(aggfunc="sum").fillna(0) without the generic pivot machinery.
+    observed=True keeps categorical columns from expanding to every combination.
+    Large frames with plain numpy measures and non-categorical keys build the
+    same grid with _bincount_grid instead.
+    """
+    import pandas as pd
+
+    values = df[value_col]
+    if (len(df) >= _FAST_PIVOT_MIN_ROWS and values.dtype.kind in "if"
+            and not isinstance(df[index_col].dtype, pd.CategoricalDtype)
+            and not isinstance(df[columns_col].dtype, pd.CategoricalDtype)):
+        grid, idx_uniques, col_uniques = _bincount_grid(df[index_col], df[columns_col], values)
+        return pd.DataFrame(grid.astype(values.dtype, copy=False),  # groupby keeps int32 etc.
+                            index=pd.Index(idx_uniques, name=index_col),
+                            columns=pd.Index(col_uniques, name=columns_col))
+
+    return (df.groupby([index_col, columns_col], observed=True)[value_col]
+              .sum()
+              .unstack(fill_value=0))
+
+
+def _pivot_grid(df, index_col, columns_col, value_col):
+    """Sum value_col into a dense index_col x columns_col grid, without labels.
+
+    For renderers that only plot the grid (line, ribbon): numeric measures go
+    straight through _bincount_grid at any size, skipping the labeled frame
+    _sum_pivot builds; other measures take _sum_pivot. Rows and columns are
+    in the same sorted order as _sum_pivot's.
+
+    Returns:
+        (index_labels: ndarray[str], column_keys: list, grid: ndarray)
+    """
+    import pandas as pd
+
+    values = df[value_col]
+    if pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values):
+        grid, idx_uniques, col_uniques = _bincount_grid(df[index_col], df[columns_col], values)
+        return pd.Index(idx_uniques).astype(str).to_numpy(), list(col_uniques), grid
+    pivot_df = _sum_pivot(df, index_col, columns_col, value_col)
+    return pivot_df.index.astype(str).to_numpy(), list(pivot_df.columns), pivot_df.to_numpy()
+
+
+def _pivot_series_data(df, index_col, series_col, value_col):
+    """Sum value_col by (index_col, series_col) and split the result into series.
+
+    Numeric values are summed straight into a categories x series grid by
+    _bincount_grid, instead of going through groupby/unstack. Non-numeric value
+    columns keep the groupby path.
+
+    Returns:
+        (cat_labels: list[str], series_data: dict[str, ndarray], True)
+    """
+    import pandas as pd
+
+    values = df[value_col]
+    if not (pd.api.types.is_numeric_dtype(values) and not pd.api.types.is_bool_dtype(values)):
+        pivot_df = _sum_pivot(df, index_col, series_col, value_col)
+        sorted_index = _sort_categories(list(pivot_df.index))
+        pivot_df = pivot_df.reindex(sorted_index)
+        cat_labels = [str(c) for c in pivot_df.index]
+        # Rows of the transposed grid are views — no per-value Python floats
+        series_data = dict(zip(map(str, pivot_df.columns), pivot_df.to_numpy().T))
+        return cat_labels, series_data, True
+
+    grid, cat_uniques, ser_uniques = _bincount_grid(df[index_col], df[series_col], values)
+
+    cat_list = list(cat_uniques)
+    sorted_cats = _sort_categories(cat_list)
+    if sorted_cats is not cat_list:
+        order = sorted(range(len(cat_list)), key=lambda i: _MONTH_RANK[str(cat_list[i]).strip()])
+        grid = grid[order]
+    cat_labels = [str(c) for c in sorted_cats]
+    series_data = dict(zip(map(str, ser_uniques), grid.T))
+    return cat_labels, series_data, True
+
+
+def _str_labels(col):
+    """Return a column's values as a list of str labels.
+
+    String-dtype columns (the default for text in pandas 3) are listed
+    directly instead of round-tripping every value through str(); columns
+    with missing values still go through astype(str) so NaN labels render
+    the same as before.
+    """
+    import pandas as pd
+
+    if isinstance(col.dtype, pd.StringDtype) and not col.hasnans:
+        return col.tolist()
+    return col.astype(str).tolist()
+
+
 def _prepare_series_data(df, categories, values, series=None):
     """Prepare category labels and series data for bar/column/stacked charts.
 
@@ -271,43 +655,73 @@ def _prepare_series_data(df, categories, values, series=None):
                 When provided (well-aware mode), overrides the legacy 2-grouping heuristic.
 
     Returns:
-        (cat_labels: list[str], series_data: OrderedDict[str, list[float]], needs_legend: bool)
-    """
-    from collections import OrderedDict
+        (cat_labels: list[str], series_data: dict[str, ndarray], needs_legend: bool)
 
+    Series values stay numpy arrays (plotly takes them as-is) rather than
+    being boxed into Python float lists.
+    """
     # Well-aware: explicit Legend column provided
     if series and len(series) == 1 and len(values) == 1 and categories:
-        pivot_df = df.pivot_table(
-            index=categories[0], columns=series[0],
-            values=values[0], aggfunc="sum"
-        ).fillna(0)
-        sorted_index = _sort_categories(list(pivot_df.index))
-        pivot_df = pivot_df.reindex(sorted_index)
-        cat_labels = [str(c) for c in pivot_df.index]
-        series_data = OrderedDict((str(col), pivot_df[col].tolist()) for col in pivot_df.columns)
-        return cat_labels, series_data, True
+        return _pivot_series_data(df, categories[0], series[0], values[0])
 
     # Legacy: treat second grouping column as legend when no explicit series
     if len(categories) >= 2 and len(values) == 1:
-        pivot_df = df.pivot_table(
-            index=categories[0], columns=categories[1],
-            values=values[0], aggfunc="sum"
-        ).fillna(0)
-        sorted_index = _sort_categories(list(pivot_df.index))
-        pivot_df = pivot_df.reindex(sorted_index)
-        cat_labels = [str(c) for c in pivot_df.index]
-        series_data = OrderedDict((str(col), pivot_df[col].tolist()) for col in pivot_df.columns)
-        return cat_labels, series_data, True
+        return _pivot_series_data(df, categories[0], categories[1], values[0])
 
-    sorted_vals = _sort_categories(df[categories[0]].astype(str).tolist())
-    if sorted_vals != df[categories[0]].astype(str).tolist():
+    cat_labels = _str_labels(df[categories[0]])
+    sorted_vals = _sort_categories(cat_labels)
+    if sorted_vals != cat_labels:
         df = df.set_index(categories[0]).reindex(sorted_vals).reset_index()
-    cat_labels = df[categories[0]].astype(str).tolist()
-    series_data = OrderedDict((v, df[v].tolist()) for v in values)
+        cat_labels = _str_labels(df[categories[0]])
+    if len(values) == 1:
+        # Single measure, no legend: the column is the series — skip building
+        # and transposing a one-column measure block
+        series_data = {values[0]: df[values[0]].to_numpy()}
+    else:
+        # One transpose of the measure block instead of a .to_numpy() per column
+        series_data = dict(zip(values, df[values].to_numpy().T))
     needs_legend = len(values) > 1
     return cat_labels, series_data, needs_legend
 
 
+@lru_cache(maxsize=None)
+def _get_dax_helpers():
+    """Import (read_extractor_output, classify_field) from the sibling
+    dax_query_builder module once, adding the skills dir to sys.path if needed."""
+    skills_dir = os.path.dirname(os.path.abspath(__file__))
+    if skills_dir not in sys.path:
+        sys.path.insert(0, skills_dir)
+    from dax_query_builder import read_extractor_output, classify_field
+    return read_extractor_output, classify_field
+
+
+@lru_cache(maxsize=8)
+def _load_visual_index(metadata_path, mtime_ns):
+    """Read a metadata workbook once and index its visuals by normalized name.
+
+    Keyed by (absolute path, mtime_ns) so charting many visuals from the same
+    workbook parses it once, while an edited workbook is read again.
+    Every name is normalized once; the first visual wins on duplicate names.
+
+    Returns:
+        (visuals, normalized, by_full_name, by_visual_name) where normalized
+        holds (key, "page / visual" lowered) in order.
+    """
+    read_extractor_output, _ = _get_dax_helpers()
+
+    visuals, _, _, _ = read_extractor_output(metadata_path)
+    normalized = []
+    by_full_name = {}
+    by_visual_name = {}
+    for key, data in visuals.items():
+        name_lower = data["visual_name"].lower()
+        full_name = f"{key[0]} / {data['visual_name']}".lower()
+        normalized.append((key, full_name))
+        by_full_name.setdefault(full_name, key)
+        by_visual_name.setdefault(name_lower.strip(), key)
+    return visuals, normalized, by_full_name, by_visual_name
+
+
 def parse_visual_from_metadata(metadata_excel, visual_name):
     """Read metadata Excel (from Skill 1) and build a VisualSpec for a named visual.
 
@@ -317,41 +731,23 @@ def parse_visual_from_metadata(metadata_excel, visual_name):
     Returns:
         VisualSpec or None if visual not found
     """
-    # Import from sibling module (same directory)
-    skills_dir = os.path.dirname(os.path.abspath(__file__))
-    if skills_dir not in sys.path:
-        sys.path.insert(0, skills_dir)
-    from dax_query_builder import read_extractor_output, classify_field
+    _, classify_field = _get_dax_helpers()
 
-    visuals, _, _, _ = read_extractor_output(metadata_excel)
+    metadata_path = os.path.abspath(metadata_excel)
+    visuals, normalized, by_full_name, by_visual_name = _load_visual_index(
+        metadata_path, os.stat(metadata_path).st_mtime_ns)
 
     # Find the visual by name (case-insensitive, supports "Page / Visual" format)
     target = visual_name.lower().strip()
-    matched_key = None
-
-    # First try exact match on "page / visual" combined key
-    for key, data in visuals.items():
-        page = key[0]
-        full_name = f"{page} / {data['visual_name']}".lower()
-        if full_name == target:
-            matched_key = key
-            break
 
-    # Then try exact match on visual name alone
-    if not matched_key:
-        for key, data in visuals.items():
-            if data["visual_name"].lower().strip() == target:
-                matched_key = key
-                break
+    # Exact "page / visual" match, then exact visual name match
+    matched_key = by_full_name.get(target) or by_visual_name.get(target)
 
-    # Partial match fallback (also checks "page / visual" combined)
+    # Partial match fallback against "page / visual" — the combined name
+    # contains the visual name, so one substring test covers both
     if not matched_key:
-        for key, data in visuals.items():
-            page = key[0]
-            full_name = f"{page} / {data['visual_name']}".lower()
-            if target in data["visual_name"].lower() or target in full_name:
-                matched_key = key
-                break
+        matched_key = next((key for key, full_name in normalized
+                            if target in full_name), None)
 
     if not matched_key:
         print(f"ERROR: Visual '{visual_name}' not found in metadata.")
@@ -416,11 +812,11 @@ def parse_visual_from_metadata(metadata_excel, visual_name):
     return VisualSpec(
         page_name=page_name,
         visual_name=data["visual_name"],
-        visual_type=data["visual_type"],
-        grouping_columns=grouping_cols,
-        measure_columns=measure_cols,
-        y2_columns=y2_cols,
-        series_columns=series_cols,
+        visual_type=_canonical_type(data["visual_type"]),
+        grouping_columns=tuple(grouping_cols),
+        measure_columns=tuple(measure_cols),
+        y2_columns=tuple(y2_cols),
+        series_columns=tuple(series_cols),
         facet_column=facet_col,
     )
 
@@ -429,152 +825,109 @@ def parse_visual_from_metadata(metadata_excel, visual_name):
 # CHART RENDERERS — each returns a plotly Figure
 # =============================================================================
 
-# ---- Bar chart (horizontal) ----
+def _bar_traces(cat_labels, series, horizontal, stacked):
+    """Bar trace dicts for the bar/column family, one per series.
 
-def _render_bar(df, spec):
-    """Horizontal bar chart. Categories on Y-axis, values on X-axis.
+    Series stay separate traces rather than one merged trace: legend entries,
+    grouped offsets and barnorm="percent" are all per trace in plotly.
+    """
+    cat_key, value_key = ("y", "x") if horizontal else ("x", "y")
+    textposition = "inside" if stacked else "outside"
+    textfont = _LABEL_FONT_INSIDE if stacked else _LABEL_FONT
+    traces = []
+    for (name, data), color in zip(series.items(), pbi_color_cycle()):
+        trace = {
+            "type": "bar", cat_key: cat_labels, value_key: data, "name": name,
+            "marker": {"color": color},
+            "text": [f"{v:,.0f}" for v in data],
+            "textposition": textposition,
+            "textfont": textfont,
+        }
+        if horizontal:
+            trace["orientation"] = "h"
+        traces.append(trace)
+    return traces
 
-    Handles single measure (one series) or multiple measures (grouped bars).
-    With 2+ grouping columns, pivots second column into legend series.
+
+def _bars_figure_dict(df, spec, horizontal, stacked):
+    """Bar/column family (clustered, stacked, 100%) as a plain figure dict.
+
+    The one builder behind _render_bar/_render_column/_render_stacked_* and
+    generate_chart(as_dict=True), so both outputs stay identical. Trace data
+    stays numpy arrays and the layout shares nested dicts with _PBI_LAYOUT
+    (see _chart_layout) — hand it to plotly, never mutate it. Returns None
+    when the visual needs the table fallback.
     """
     categories, values = classify_columns(df, spec)
     if not categories or not values:
-        return _render_table(df, spec)
+        return None
 
-    # Sort by first measure descending for clean ranking (like PBI default)
-    if len(values) == 1 and len(categories) == 1:
-        df = df.sort_values(values[0], ascending=False)  # highest at top with reversed y-axis
+    # Sort by first measure descending for clean ranking (like PBI default);
+    # with reversed y-axis the highest bar is at the top
+    if not stacked and len(values) == 1 and len(categories) == 1:
+        df = df.sort_values(values[0], ascending=False)
 
+    # With 2+ grouping columns (or a Legend field), pivots into legend series
     series_cols = _resolve_series(df, spec)
     cat_labels, series, needs_legend = _prepare_series_data(df, categories, values, series_cols)
 
-    fig = go.Figure()
-    for i, (name, data) in enumerate(series.items()):
-        fig.add_trace(go.Bar(
-            y=cat_labels, x=data, name=name, orientation="h",
-            marker_color=PBI_COLORS[i % len(PBI_COLORS)],
-            text=[f"{v:,.0f}" for v in data],
-            textposition="outside",
-            textfont={"size": 9, "family": PBI_FONT},
-        ))
-
-    fig.update_layout(
-        **get_pbi_plotly_layout(),
-        title=spec.visual_name,
-        barmode="group",
-        showlegend=needs_legend,
-        xaxis_title=values[0] if len(values) == 1 else None,
-        yaxis_title=categories[0] if categories else None,
-    )
-    fig.update_yaxes(autorange="reversed")  # top-to-bottom ordering like PBI
-    return fig
+    cat_title = categories[0]
+    value_title = values[0] if len(values) == 1 else None
+    layout_kwargs = {
+        "barmode": "stack" if stacked else "group",
+        "showlegend": True if stacked else needs_legend,
+        "xaxis_title": value_title if horizontal else cat_title,
+        "yaxis_title": cat_title if horizontal else value_title,
+        "reverse_y": horizontal,  # top-to-bottom ordering like PBI
+    }
+    if stacked and _dispatch(spec.visual_type).hundred:
+        layout_kwargs["barnorm"] = "percent"
+    return {
+        "data": _bar_traces(cat_labels, series, horizontal, stacked),
+        "layout": _chart_layout(spec.visual_name, **layout_kwargs),
+    }
 
 
-# ---- Column chart (vertical) ----
+def _bars_figure(df, spec, horizontal, stacked):
+    """go.Figure from _bars_figure_dict, or the table fallback."""
+    import plotly.graph_objects as go
 
-def _render_column(df, spec):
-    """Vertical column chart. Categories on X-axis, values on Y-axis."""
-    categories, values = classify_columns(df, spec)
-    if not categories or not values:
+    fig = _bars_figure_dict(df, spec, horizontal, stacked)
+    if fig is None:
         return _render_table(df, spec)
+    return go.Figure(data=fig["data"], layout=fig["layout"])
 
-    # Sort by first measure descending
-    if len(values) == 1 and len(categories) == 1:
-        df = df.sort_values(values[0], ascending=False)
 
-    series_cols = _resolve_series(df, spec)
-    cat_labels, series, needs_legend = _prepare_series_data(df, categories, values, series_cols)
+# ---- Bar chart (horizontal) ----
 
-    fig = go.Figure()
-    for i, (name, data) in enumerate(series.items()):
-        fig.add_trace(go.Bar(
-            x=cat_labels, y=data, name=name,
-            marker_color=PBI_COLORS[i % len(PBI_COLORS)],
-            text=[f"{v:,.0f}" for v in data],
-            textposition="outside",
-            textfont={"size": 9, "family": PBI_FONT},
-        ))
+def _render_bar(df, spec):
+    """Horizontal bar chart. Categories on Y-axis, values on X-axis.
 
-    fig.update_layout(
-        **get_pbi_plotly_layout(),
-        title=spec.visual_name,
-        barmode="group",
-        showlegend=needs_legend,
-        xaxis_title=categories[0] if categories else None,
-        yaxis_title=values[0] if len(values) == 1 else None,
-    )
-    return fig
+    Handles single measure (one series) or multiple measures (grouped bars).
+    With 2+ grouping columns, pivots second column into legend series.
+    """
+    return _bars_figure(df, spec, horizontal=True, stacked=False)
+
+
+# ---- Column chart (vertical) ----
+
+def _render_column(df, spec):
+    """Vertical column chart. Categories on X-axis, values on Y-axis."""
+    return _bars_figure(df, spec, horizontal=False, stacked=False)
 
 
 # ---- Stacked bar (horizontal) ----
 
 def _render_stacked_bar(df, spec):
     """Horizontal stacked bar chart. Uses barmode='stack' or barnorm='percent'."""
-    categories, values = classify_columns(df, spec)
-    if not categories or not values:
-        return _render_table(df, spec)
-
-    series_cols = _resolve_series(df, spec)
-    cat_labels, series, _ = _prepare_series_data(df, categories, values, series_cols)
-
-    fig = go.Figure()
-    for i, (name, data) in enumerate(series.items()):
-        fig.add_trace(go.Bar(
-            y=cat_labels, x=data, name=name, orientation="h",
-            marker_color=PBI_COLORS[i % len(PBI_COLORS)],
-            text=[f"{v:,.0f}" for v in data],
-            textposition="inside",
-            textfont={"size": 9, "family": PBI_FONT, "color": "white"},
-        ))
-
-    layout_kwargs = {
-        **get_pbi_plotly_layout(),
-        "title": spec.visual_name,
-        "barmode": "stack",
-        "showlegend": True,
-        "xaxis_title": values[0] if len(values) == 1 else None,
-        "yaxis_title": categories[0] if categories else None,
-    }
-    if "hundredPercent" in spec.visual_type:
-        layout_kwargs["barnorm"] = "percent"
-    fig.update_layout(**layout_kwargs)
-    fig.update_yaxes(autorange="reversed")  # top-to-bottom ordering like PBI
-    return fig
+    return _bars_figure(df, spec, horizontal=True, stacked=True)
 
 
 # ---- Stacked column (vertical) ----
 
 def _render_stacked_column(df, spec):
     """Vertical stacked column chart. Uses barmode='stack' or barnorm='percent'."""
-    categories, values = classify_columns(df, spec)
-    if not categories or not values:
-        return _render_table(df, spec)
-
-    series_cols = _resolve_series(df, spec)
-    cat_labels, series, _ = _prepare_series_data(df, categories, values, series_cols)
-
-    fig = go.Figure()
-    for i, (name, data) in enumerate(series.items()):
-        fig.add_trace(go.Bar(
-            x=cat_labels, y=data, name=name,
-            marker_color=PBI_COLORS[i % len(PBI_COLORS)],
-            text=[f"{v:,.0f}" for v in data],
-            textposition="inside",
-            textfont={"size": 9, "family": PBI_FONT, "color": "white"},
-        ))
-
-    layout_kwargs = {
-        **get_pbi_plotly_layout(),
-        "title": spec.visual_name,
-        "barmode": "stack",
-        "showlegend": True,
-        "xaxis_title": categories[0] if categories else None,
-        "yaxis_title": values[0] if len(values) == 1 else None,
-    }
-    if "hundredPercent" in spec.visual_type:
-        layout_kwargs["barnorm"] = "percent"
-    fig.update_layout(**layout_kwargs)
-    return fig
+    return _bars_figure(df, spec, horizontal=False, stacked=True)
 
 
 # ---- Line chart ----
@@ -585,51 +938,50 @@ def _render_line(df, spec):
     Data is sorted by the category column for proper line ordering.
     With 2+ grouping columns, pivots second into legend series.
     """
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
     if not categories or not values:
         return _render_table(df, spec)
 
-    df_sorted = df.sort_values(categories[0])
-
     if len(categories) >= 2 and len(values) == 1:
-        pivot_df = df_sorted.pivot_table(
-            index=categories[0], columns=categories[1],
-            values=values[0], aggfunc="sum"
-        ).fillna(0)
-        fig = go.Figure()
-        for i, col in enumerate(pivot_df.columns):
-            col_data = pivot_df[col].tolist()
-            fig.add_trace(go.Scatter(
-                x=pivot_df.index.astype(str), y=col_data,
-                name=str(col), mode="lines+markers+text",
-                line={"color": PBI_COLORS[i % len(PBI_COLORS)]},
-                text=[f"{v:,.0f}" for v in col_data],
-                textposition="top center",
-                textfont={"size": 9, "family": PBI_FONT},
-            ))
+        # The pivot sorts the keys itself; a stable pre-sort would not change the sums
+        cat_labels, series_keys, grid = _pivot_grid(df, categories[0], categories[1], values[0])
+        traces = []
+        for col, col_data, color in zip(series_keys, grid.T, pbi_color_cycle()):
+            traces.append({
+                "type": "scatter",
+                "x": cat_labels, "y": col_data,
+                "name": str(col), "mode": "lines+markers+text",
+                "line": {"color": color},
+                "text": [f"{v:,.0f}" for v in col_data],
+                "textposition": "top center",
+                "textfont": _LABEL_FONT,
+            })
         needs_legend = True
     else:
-        fig = go.Figure()
-        cat_labels = df_sorted[categories[0]].astype(str).tolist()
-        for i, v in enumerate(values):
-            v_data = df_sorted[v].tolist()
-            fig.add_trace(go.Scatter(
-                x=cat_labels, y=v_data,
-                name=v, mode="lines+markers+text",
-                line={"color": PBI_COLORS[i % len(PBI_COLORS)]},
-                text=[f"{val:,.0f}" for val in v_data],
-                textposition="top center",
-                textfont={"size": 9, "family": PBI_FONT},
-            ))
+        df_sorted = _sorted_by(df, categories[0], values)
+        traces = []
+        cat_labels = _col_array(df_sorted, categories[0], as_str=True)
+        for v, color in zip(values, pbi_color_cycle()):
+            v_data = _col_array(df_sorted, v)
+            traces.append({
+                "type": "scatter",
+                "x": cat_labels, "y": v_data,
+                "name": v, "mode": "lines+markers+text",
+                "line": {"color": color},
+                "text": [f"{val:,.0f}" for val in v_data],
+                "textposition": "top center",
+                "textfont": _LABEL_FONT,
+            })
         needs_legend = len(values) > 1
 
-    fig.update_layout(
-        **get_pbi_plotly_layout(),
-        title=spec.visual_name,
+    fig = go.Figure(data=traces, layout=_chart_layout(
+        spec.visual_name,
         showlegend=needs_legend,
         xaxis_title=categories[0] if categories else None,
         yaxis_title=values[0] if len(values) == 1 else None,
-    )
+    ))
     return fig
 
 
@@ -640,36 +992,38 @@ def _render_area(df, spec):
 
     Stacked area uses stackgroup for overlapping fills.
     """
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
     if not categories or not values:
         return _render_table(df, spec)
 
-    is_stacked = "stacked" in spec.visual_type.lower()
-    df_sorted = df.sort_values(categories[0])
+    is_stacked = _dispatch(spec.visual_type).stacked
+    df_sorted = _sorted_by(df, categories[0], values)
 
-    fig = go.Figure()
-    cat_labels = df_sorted[categories[0]].astype(str).tolist()
-    for i, v in enumerate(values):
-        trace_kwargs = {
+    traces = []
+    cat_labels = _col_array(df_sorted, categories[0], as_str=True)
+    for v, color in zip(values, pbi_color_cycle()):
+        trace = {
+            "type": "scatter",
             "x": cat_labels,
-            "y": df_sorted[v].tolist(),
+            "y": _col_array(df_sorted, v),
             "name": v,
             "mode": "lines",
-            "line": {"color": PBI_COLORS[i % len(PBI_COLORS)]},
+            "line": {"color": color},
         }
         if is_stacked:
-            trace_kwargs["stackgroup"] = "one"
+            trace["stackgroup"] = "one"
         else:
-            trace_kwargs["fill"] = "tozeroy"
-        fig.add_trace(go.Scatter(**trace_kwargs))
+            trace["fill"] = "tozeroy"
+        traces.append(trace)
 
-    fig.update_layout(
-        **get_pbi_plotly_layout(),
-        title=spec.visual_name,
+    fig = go.Figure(data=traces, layout=_chart_layout(
+        spec.visual_name,
         showlegend=len(values) > 1,
         xaxis_title=categories[0] if categories else None,
         yaxis_title=values[0] if len(values) == 1 else None,
-    )
+    ))
     return fig
 
 
@@ -681,21 +1035,23 @@ def _render_pie(df, spec):
     Only uses first measure (pie charts show one value series). Warns if multiple.
     Measures-only case: each measure name becomes a slice label, each value a slice size.
     """
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
 
     # Measures-only: no grouping column, each measure is a slice
     if not categories and len(values) >= 2:
-        row = df.iloc[0]
         slice_labels = values
-        slice_values = [float(row[v]) if pd.notna(row[v]) else 0 for v in values]
-        fig = go.Figure(go.Pie(
-            labels=slice_labels,
-            values=slice_values,
-            marker={"colors": PBI_COLORS[:len(values)]},
-            textinfo="percent+label",
-            textfont={"size": 11, "family": PBI_FONT},
-            hole=0,
-        ))
+        slice_values = _first_row_floats(df, values)
+        fig = go.Figure([{
+            "type": "pie",
+            "labels": slice_labels,
+            "values": slice_values,
+            "marker": {"colors": pbi_colors(len(slice_values))},
+            "textinfo": "percent+label",
+            "textfont": _SLICE_FONT,
+            "hole": 0,
+        }])
         fig.update_layout(
             title=spec.visual_name,
             font={"family": PBI_FONT, "size": 12, "color": "#333333"},
@@ -709,17 +1065,18 @@ def _render_pie(df, spec):
         return _render_table(df, spec)
 
     if len(values) > 1:
-        print(f"  WARNING: Pie chart '{spec.visual_name}' has {len(values)} measures "
-              f"-- using only '{values[0]}'")
-
-    fig = go.Figure(go.Pie(
-        labels=df[categories[0]].astype(str).tolist(),
-        values=df[values[0]].tolist(),
-        marker={"colors": PBI_COLORS[:len(df)]},
-        textinfo="percent+label+value",
-        textfont={"size": 11, "family": PBI_FONT},
-        hole=0,
-    ))
+        logger.warning("Pie chart '%s' has %d measures -- using only '%s'",
+                       spec.visual_name, len(values), values[0])
+
+    fig = go.Figure([{
+        "type": "pie",
+        "labels": _str_labels(df[categories[0]]),
+        "values": df[values[0]].tolist(),
+        "marker": {"colors": pbi_colors(len(df))},
+        "textinfo": "percent+label+value",
+        "textfont": _SLICE_FONT,
+        "hole": 0,
+    }])
     fig.update_layout(
         title=spec.visual_name,
         font={"family": PBI_FONT, "size": 12, "color": "#333333"},
@@ -737,21 +1094,23 @@ def _render_donut(df, spec):
 
     Measures-only case: each measure name becomes a slice label, each value a slice size.
     """
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
 
     # Measures-only: no grouping column, each measure is a slice
     if not categories and len(values) >= 2:
-        row = df.iloc[0]
         slice_labels = values
-        slice_values = [float(row[v]) if pd.notna(row[v]) else 0 for v in values]
-        fig = go.Figure(go.Pie(
-            labels=slice_labels,
-            values=slice_values,
-            marker={"colors": PBI_COLORS[:len(values)]},
-            textinfo="percent+label+value",
-            textfont={"size": 11, "family": PBI_FONT},
-            hole=0.4,
-        ))
+        slice_values = _first_row_floats(df, values)
+        fig = go.Figure([{
+            "type": "pie",
+            "labels": slice_labels,
+            "values": slice_values,
+            "marker": {"colors": pbi_colors(len(slice_values))},
+            "textinfo": "percent+label+value",
+            "textfont": _SLICE_FONT,
+            "hole": 0.4,
+        }])
         fig.update_layout(
             title=spec.visual_name,
             font={"family": PBI_FONT, "size": 12, "color": "#333333"},
@@ -765,17 +1124,18 @@ def _render_donut(df, spec):
         return _render_table(df, spec)
 
     if len(values) > 1:
-        print(f"  WARNING: Donut chart '{spec.visual_name}' has {len(values)} measures "
-              f"-- using only '{values[0]}'")
-
-    fig = go.Figure(go.Pie(
-        labels=df[categories[0]].astype(str).tolist(),
-        values=df[values[0]].tolist(),
-        marker={"colors": PBI_COLORS[:len(df)]},
-        textinfo="percent+label+value",
-        textfont={"size": 11, "family": PBI_FONT},
-        hole=0.4,
-    ))
+        logger.warning("Donut chart '%s' has %d measures -- using only '%s'",
+                       spec.visual_name, len(values), values[0])
+
+    fig = go.Figure([{
+        "type": "pie",
+        "labels": _str_labels(df[categories[0]]),
+        "values": df[values[0]].tolist(),
+        "marker": {"colors": pbi_colors(len(df))},
+        "textinfo": "percent+label+value",
+        "textfont": _SLICE_FONT,
+        "hole": 0.4,
+    }])
     fig.update_layout(
         title=spec.visual_name,
         font={"family": PBI_FONT, "size": 12, "color": "#333333"},
@@ -788,12 +1148,21 @@ def _render_donut(df, spec):
 
 # ---- Scatter chart ----
 
+# From this many points, scatter traces render through WebGL (scattergl):
+# SVG draws one DOM node per marker and label, which stalls well before that
+_SCATTERGL_MIN_POINTS = 5000
+
+
 def _render_scatter(df, spec):
     """Scatter plot. X = first measure, Y = second measure.
 
     If a grouping column exists, it becomes the point labels/color grouper.
     Third measure (if present) maps to marker size (bubble chart).
     """
+    import numpy as np
+    import pandas as pd
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
     if len(values) < 2:
         return _render_table(df, spec)
@@ -806,50 +1175,62 @@ def _render_scatter(df, spec):
         if pd.isna(max_bubble) or max_bubble <= 0:
             has_bubble = False
 
-    fig = go.Figure()
-
+    trace_type = "scattergl" if len(df) >= _SCATTERGL_MIN_POINTS else "scatter"
+    traces = []
     if categories:
-        groups = df.groupby(categories[0])
-        for i, (name, group) in enumerate(groups):
-            trace_kwargs = {
-                "x": group[values[0]].tolist(),
-                "y": group[values[1]].tolist(),
+        # One trace per group (keeps the legend), but split the columns with a
+        # single factorize + stable argsort instead of materializing a
+        # sub-DataFrame per group. sort=True matches groupby's group order;
+        # NaN categories get code -1 and sort ahead of the first slice.
+        codes, uniques = pd.factorize(df[categories[0]], sort=True)
+        order = np.argsort(codes, kind="stable")
+        bounds = np.searchsorted(codes[order], np.arange(len(uniques) + 1))
+        x_all = _col_array(df, values[0])[order]
+        y_all = _col_array(df, values[1])[order]
+        text_all = _col_array(df, categories[0], as_str=True)[order]
+        size_all = _col_array(df, values[2])[order] if has_bubble else None
+        for i, (name, color) in enumerate(zip(uniques, pbi_color_cycle())):
+            lo, hi = bounds[i], bounds[i + 1]
+            trace = {
+                "type": trace_type,
+                "x": x_all[lo:hi],
+                "y": y_all[lo:hi],
                 "name": str(name),
                 "mode": "markers+text",
-                "marker": {"color": PBI_COLORS[i % len(PBI_COLORS)], "size": 10},
-                "text": group[categories[0]].astype(str).tolist(),
+                "marker": {**_MARKER_TPL, "color": color},
+                "text": text_all[lo:hi],
                 "textposition": "top center",
-                "textfont": {"size": 9, "family": PBI_FONT},
+                "textfont": _LABEL_FONT,
             }
             if has_bubble:
-                trace_kwargs["marker"]["size"] = group[values[2]].tolist()
-                trace_kwargs["marker"]["sizemode"] = "area"
-                trace_kwargs["marker"]["sizeref"] = 2.0 * max_bubble / (40.0 ** 2)
-            fig.add_trace(go.Scatter(**trace_kwargs))
+                trace["marker"]["size"] = size_all[lo:hi]
+                trace["marker"]["sizemode"] = "area"
+                trace["marker"]["sizeref"] = 2.0 * max_bubble / (40.0 ** 2)
+            traces.append(trace)
     else:
-        y_data = df[values[1]].tolist()
-        trace_kwargs = {
-            "x": df[values[0]].tolist(),
+        y_data = _col_array(df, values[1])
+        trace = {
+            "type": trace_type,
+            "x": _col_array(df, values[0]),
             "y": y_data,
             "mode": "markers+text",
-            "marker": {"color": PBI_COLORS[0], "size": 10},
+            "marker": {**_MARKER_TPL, "color": PBI_COLORS[0]},
             "text": [f"{v:,.0f}" for v in y_data],
             "textposition": "top center",
-            "textfont": {"size": 9, "family": PBI_FONT},
+            "textfont": _LABEL_FONT,
         }
         if has_bubble:
-            trace_kwargs["marker"]["size"] = df[values[2]].tolist()
-            trace_kwargs["marker"]["sizemode"] = "area"
-            trace_kwargs["marker"]["sizeref"] = 2.0 * max_bubble / (40.0 ** 2)
-        fig.add_trace(go.Scatter(**trace_kwargs))
+            trace["marker"]["size"] = _col_array(df, values[2])
+            trace["marker"]["sizemode"] = "area"
+            trace["marker"]["sizeref"] = 2.0 * max_bubble / (40.0 ** 2)
+        traces.append(trace)
 
-    fig.update_layout(
-        **get_pbi_plotly_layout(),
-        title=spec.visual_name,
+    fig = go.Figure(data=traces, layout=_chart_layout(
+        spec.visual_name,
         xaxis_title=values[0],
         yaxis_title=values[1],
         showlegend=bool(categories),
-    )
+    ))
     return fig
 
 
@@ -862,35 +1243,34 @@ def _render_waterfall(df, spec):
     All values treated as relative (incremental). PBI blue for positive,
     PBI red for negative.
     """
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
     if not categories or not values:
         return _render_table(df, spec)
 
-    cat_labels = df[categories[0]].astype(str).tolist()
-    val_data = df[values[0]].tolist()
-
-    # All bars are relative (incremental values)
-    measure_types = ["relative"] * len(val_data)
-
-    fig = go.Figure(go.Waterfall(
-        x=cat_labels,
-        y=val_data,
-        measure=measure_types,
-        connector={"line": {"color": "#E0E0E0"}},
-        increasing={"marker": {"color": PBI_COLORS[0]}},   # blue for positive
-        decreasing={"marker": {"color": PBI_COLORS[7]}},    # red for negative
-        totals={"marker": {"color": PBI_COLORS[1]}},        # dark blue for totals
-        text=[f"{v:,.0f}" for v in val_data],
-        textposition="outside",
-        textfont={"size": 9, "family": PBI_FONT},
-    ))
-    fig.update_layout(
-        **get_pbi_plotly_layout(),
-        title=spec.visual_name,
+    cat_labels = _col_array(df, categories[0], as_str=True)
+    val_data = _col_array(df, values[0])
+
+    # All bars are relative (incremental values) — plotly's default when no
+    # "measure" array is given, so none is built
+    fig = go.Figure([{
+        "type": "waterfall",
+        "x": cat_labels,
+        "y": val_data,
+        "connector": {"line": {"color": "#E0E0E0"}},
+        "increasing": {"marker": {"color": PBI_COLORS[0]}},   # blue for positive
+        "decreasing": {"marker": {"color": PBI_COLORS[7]}},    # red for negative
+        "totals": {"marker": {"color": PBI_COLORS[1]}},        # dark blue for totals
+        "text": [f"{v:,.0f}" for v in val_data.tolist()],
+        "textposition": "outside",
+        "textfont": _LABEL_FONT,
+    }], layout=_chart_layout(
+        spec.visual_name,
         showlegend=False,
         xaxis_title=categories[0] if categories else None,
         yaxis_title=values[0] if len(values) == 1 else None,
-    )
+    ))
     return fig
 
 
@@ -906,6 +1286,9 @@ def _render_combo(df, spec):
        the PBI "small multiples" layout.
     2. Dual-axis combo (2+ measures): bars on primary Y, line on secondary Y.
     """
+    import plotly.graph_objects as go
+    from plotly.subplots import make_subplots
+
     categories, values = classify_columns(df, spec)
     if not categories or not values:
         return _render_table(df, spec)
@@ -916,16 +1299,8 @@ def _render_combo(df, spec):
     explicit_facet = getattr(spec, "facet_column", "")
     if explicit_facet or (len(values) == 1 and len(categories) >= 2):
         # Resolve facet column from df
-        df_cols_lower_combo = {c.lower().strip(): c for c in df.columns}
-        df_cols_bare_combo = {_bare_column_name(c).lower().strip(): c for c in df.columns}
-        def _find_col_combo(name):
-            key = name.lower().strip()
-            return (df_cols_lower_combo.get(key)
-                    or df_cols_bare_combo.get(key)
-                    or df_cols_lower_combo.get(_bare_column_name(name).lower().strip()))
-
         if explicit_facet:
-            facet_col_actual = _find_col_combo(explicit_facet)
+            facet_col_actual = _find_df_column(df, explicit_facet)
         else:
             facet_col_actual = None
 
@@ -956,26 +1331,26 @@ def _render_combo(df, spec):
             shared_yaxes=True,
         )
 
-        for col_idx, facet_val in enumerate(facet_values, start=1):
-            sub_df = df[df[facet_col] == facet_val].copy()
-            # Reindex to full x_order, fill missing with 0
-            sub_df = sub_df.set_index(x_col).reindex(all_x).fillna(0).reset_index()
-            y_vals = sub_df[measure].tolist()
-            color = PBI_COLORS[col_idx - 1]
-
-            fig.add_trace(
-                go.Bar(
-                    x=all_x,
-                    y=y_vals,
-                    name=str(facet_val),
-                    marker_color=color,
-                    showlegend=False,
-                    text=[f"${v/1000:.0f}K" if v >= 1000 else f"${v:.0f}" for v in y_vals],
-                    textposition="outside",
-                    textfont={"size": 8, "family": PBI_FONT},
-                ),
-                row=1, col=col_idx,
-            )
+        facet_colors = pbi_color_cycle()
+        facet_traces = []
+        for col_idx, (facet_val, color) in enumerate(zip(facet_values, facet_colors), start=1):
+            sub_df = df[df[facet_col] == facet_val]
+            # Reindex the measure to full x_order, fill missing with 0. Only the
+            # measure is filled: grouping columns may be categorical (see
+            # _categorize_groupings), which rejects a 0 fill value.
+            y_vals = sub_df.set_index(x_col)[measure].reindex(all_x).fillna(0).tolist()
+
+            facet_traces.append({
+                "type": "bar",
+                "x": all_x,
+                "y": y_vals,
+                "name": str(facet_val),
+                "marker": {"color": color},
+                "showlegend": False,
+                "text": [f"${v/1000:.0f}K" if v >= 1000 else f"${v:.0f}" for v in y_vals],
+                "textposition": "outside",
+                "textfont": {"size": 8, "family": PBI_FONT},
+            })
             # Subtitle annotation (facet label at the bottom)
             fig.update_xaxes(
                 tickangle=45,
@@ -991,6 +1366,8 @@ def _render_combo(df, spec):
                 tickfont={"size": 9, "family": PBI_FONT},
                 row=1, col=col_idx,
             )
+        # One trace per facet column, added in a single call
+        fig.add_traces(facet_traces, rows=1, cols=list(range(1, n_facets + 1)))
 
         fig.update_layout(
             title=spec.visual_name,
@@ -1004,73 +1381,61 @@ def _render_combo(df, spec):
         return fig
 
     # --- Mode 2: dual-axis combo (2+ measures) ---
-    sorted_index = _sort_categories(df[categories[0]].astype(str).tolist())
-    if sorted_index != df[categories[0]].astype(str).tolist():
+    cat_labels = _str_labels(df[categories[0]])
+    sorted_index = _sort_categories(cat_labels)
+    if sorted_index != cat_labels:
         df = df.set_index(categories[0]).reindex(sorted_index).reset_index()
-    cat_labels = df[categories[0]].astype(str).tolist()
-
-    # Resolve actual column names for y2 (case-insensitive match against df)
-    df_cols_lower = {c.lower().strip(): c for c in df.columns}
-    y2_actual = set()
-    for y2 in spec.y2_columns:
-        actual = df_cols_lower.get(y2.lower().strip())
-        if actual:
-            y2_actual.add(actual)
+        cat_labels = _str_labels(df[categories[0]])
+
+    bar_measures, line_measures = _split_combo_measures(df, spec, values)
+
+    # Traces are pinned to the cached subplot axes by name (x/y for bars,
+    # x/y2 for lines) — what add_trace(secondary_y=...) would have set.
+    traces = []
+    for m, color in zip(bar_measures, pbi_color_cycle()):
+        bar_data = _col_array(df, m)
+        traces.append({
+            "type": "bar",
+            "x": cat_labels, "y": bar_data, "name": m,
+            "marker": {"color": color},
+            "text": [f"{v:,.0f}" for v in bar_data],
+            "textposition": "outside",
+            "textfont": _LABEL_FONT,
+            "xaxis": "x", "yaxis": "y",
+        })
+
+    # Line colors continue the palette after the bars
+    line_colors = islice(pbi_color_cycle(), len(bar_measures), None)
+    for m, color in zip(line_measures, line_colors):
+        line_data = _col_array(df, m)
+        traces.append({
+            "type": "scatter",
+            "x": cat_labels, "y": line_data, "name": m,
+            "mode": "lines+markers+text",
+            "line": {"color": color, "width": 2},
+            "text": [f"{v:,.0f}" for v in line_data],
+            "textposition": "top center",
+            "textfont": _LABEL_FONT,
+            "xaxis": "x", "yaxis": "y2",
+        })
 
-    # Split measures into bar vs line using y2 metadata when available
-    if y2_actual:
-        bar_measures = [v for v in values if v not in y2_actual]
-        line_measures = [v for v in values if v in y2_actual]
-    elif len(values) > 1:
-        # Fallback: all except last → bars, last → line
-        bar_measures = values[:-1]
-        line_measures = [values[-1]]
-    else:
-        bar_measures = values
-        line_measures = []
-
-    fig = make_subplots(specs=[[{"secondary_y": bool(line_measures)}]])
-
-    for i, m in enumerate(bar_measures):
-        bar_data = df[m].tolist()
-        fig.add_trace(go.Bar(
-            x=cat_labels, y=bar_data, name=m,
-            marker_color=PBI_COLORS[i % len(PBI_COLORS)],
-            text=[f"{v:,.0f}" for v in bar_data],
-            textposition="outside",
-            textfont={"size": 9, "family": PBI_FONT},
-        ), secondary_y=False)
-
-    for i, m in enumerate(line_measures):
-        line_data = df[m].tolist()
-        fig.add_trace(go.Scatter(
-            x=cat_labels, y=line_data, name=m,
-            mode="lines+markers+text",
-            line={"color": PBI_COLORS[(len(bar_measures) + i) % len(PBI_COLORS)], "width": 2},
-            text=[f"{v:,.0f}" for v in line_data],
-            textposition="top center",
-            textfont={"size": 9, "family": PBI_FONT},
-        ), secondary_y=True)
-
-    layout = get_pbi_plotly_layout()
+    fig = go.Figure(data=traces, layout=_combo_layout(bool(line_measures)))
     fig.update_layout(
         title=spec.visual_name,
-        font=layout["font"],
-        plot_bgcolor=layout["plot_bgcolor"],
-        paper_bgcolor=layout["paper_bgcolor"],
+        font=_PBI_LAYOUT["font"],
+        plot_bgcolor=_PBI_LAYOUT["plot_bgcolor"],
+        paper_bgcolor=_PBI_LAYOUT["paper_bgcolor"],
         barmode="group",
         showlegend=True,
-        margin=layout["margin"],
+        margin=_PBI_LAYOUT["margin"],
     )
     fig.update_xaxes(showgrid=False, linecolor="#E0E0E0",
                      title_text=categories[0] if categories else None)
     fig.update_yaxes(showgrid=True, gridcolor="#E0E0E0", linecolor="#E0E0E0")
     if bar_measures:
-        fig.update_yaxes(title_text=bar_measures[0] if len(bar_measures) == 1 else None,
-                         secondary_y=False)
+        fig.update_layout(yaxis_title_text=bar_measures[0] if len(bar_measures) == 1 else None)
     if line_measures:
-        fig.update_yaxes(title_text=line_measures[0] if len(line_measures) == 1 else None,
-                         secondary_y=True)
+        fig.update_layout(yaxis2_title_text=line_measures[0] if len(line_measures) == 1 else None)
     return fig
 
 
@@ -1078,17 +1443,20 @@ def _render_combo(df, spec):
 
 def _render_funnel(df, spec):
     """Funnel chart. Categories (stages) on Y-axis, values (counts) on X-axis."""
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
     if not categories or not values:
         return _render_table(df, spec)
 
-    fig = go.Figure(go.Funnel(
-        y=df[categories[0]].astype(str).tolist(),
-        x=df[values[0]].tolist(),
-        marker={"color": PBI_COLORS[:len(df)]},
-        textinfo="value+percent initial",
-        textfont={"family": PBI_FONT, "size": 11},
-    ))
+    fig = go.Figure([{
+        "type": "funnel",
+        "y": _col_array(df, categories[0], as_str=True),
+        "x": _col_array(df, values[0]),
+        "marker": {"color": pbi_colors(len(df))},
+        "textinfo": "value+percent initial",
+        "textfont": _SLICE_FONT,
+    }])
     fig.update_layout(
         title=spec.visual_name,
         font={"family": PBI_FONT, "size": 12, "color": "#333333"},
@@ -1108,26 +1476,29 @@ def _render_treemap(df, spec):
 
     With 2+ grouping columns, creates nested hierarchy (parent -> child).
     """
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
     if not categories or not values:
         return _render_table(df, spec)
 
     if len(categories) >= 2:
         # Nested treemap: first grouping = parent, second = child
-        labels = df[categories[1]].astype(str).tolist()
-        parents = df[categories[0]].astype(str).tolist()
+        labels = _str_labels(df[categories[1]])
+        parents = _str_labels(df[categories[0]])
     else:
-        labels = df[categories[0]].astype(str).tolist()
+        labels = _str_labels(df[categories[0]])
         parents = [""] * len(labels)
 
-    fig = go.Figure(go.Treemap(
-        labels=labels,
-        parents=parents,
-        values=df[values[0]].tolist(),
-        marker={"colors": PBI_COLORS[:len(df)]},
-        textinfo="label+value",
-        textfont={"family": PBI_FONT, "size": 12},
-    ))
+    fig = go.Figure([{
+        "type": "treemap",
+        "labels": labels,
+        "parents": parents,
+        "values": df[values[0]].tolist(),
+        "marker": {"colors": pbi_colors(len(labels))},
+        "textinfo": "label+value",
+        "textfont": {"family": PBI_FONT, "size": 12},
+    }])
     fig.update_layout(
         title=spec.visual_name,
         font={"family": PBI_FONT, "size": 12, "color": "#333333"},
@@ -1139,13 +1510,31 @@ def _render_treemap(df, spec):
 
 # ---- Gauge ----
 
+# Indicator (gauge/card/KPI) scaffolding shared across renders. Like the
+# trace fonts above, go.Figure copies these — merge, never mutate in place.
+_INDICATOR_TITLE_FONT = {"size": 16, "family": PBI_FONT}
+_CARD_TITLE_FONT = {"size": 16, "family": PBI_FONT, "color": "#666666"}
+_MULTI_CARD_TITLE_FONT = {"size": 13, "family": PBI_FONT, "color": "#666666"}
+_INDICATOR_LAYOUT = {                                               # gauge, KPI
+    "paper_bgcolor": "white",
+    "font": {"family": PBI_FONT},
+    "margin": {"l": 30, "r": 30, "t": 60, "b": 30},
+}
+_CARD_LAYOUT = {"paper_bgcolor": "white", "margin": {"l": 30, "r": 30, "t": 60, "b": 30}}
+_MULTI_CARD_LAYOUT = {"paper_bgcolor": "white", "margin": {"l": 20, "r": 20, "t": 60, "b": 20}}
+
+
 def _render_gauge(df, spec):
     """Gauge indicator. Value from first measure, optional target from second.
 
     Range auto-calculated as 0 to value * 1.2.
     """
+    import plotly.graph_objects as go
+
+    if df.empty:
+        return _render_table(df, spec)
     _, values = classify_columns(df, spec)
-    if not values or df.empty:
+    if not values:
         return _render_table(df, spec)
 
     value = float(df[values[0]].iloc[0])
@@ -1170,18 +1559,14 @@ def _render_gauge(df, spec):
             "value": target,
         }
 
-    fig = go.Figure(go.Indicator(
-        mode="gauge+number",
-        value=value,
-        title={"text": spec.visual_name, "font": {"size": 16, "family": PBI_FONT}},
-        number={"font": {"size": 36, "family": PBI_FONT, "color": "#333333"}},
-        gauge=gauge_kwargs,
-    ))
-    fig.update_layout(
-        paper_bgcolor="white",
-        font={"family": PBI_FONT},
-        margin={"l": 30, "r": 30, "t": 60, "b": 30},
-    )
+    fig = go.Figure(data=[{
+        "type": "indicator",
+        "mode": "gauge+number",
+        "value": value,
+        "title": {"text": spec.visual_name, "font": _INDICATOR_TITLE_FONT},
+        "number": {"font": {"size": 36, "family": PBI_FONT, "color": "#333333"}},
+        "gauge": gauge_kwargs,
+    }], layout=_INDICATOR_LAYOUT)
     return fig
 
 
@@ -1193,43 +1578,41 @@ def _render_card(df, spec):
     Single measure -> one big number. Multiple measures -> side-by-side indicators.
     Uses go.Indicator(mode="number") for clean big-number display.
     """
+    import plotly.graph_objects as go
+
+    if df.empty:
+        return _render_table(df, spec)
     _, values = classify_columns(df, spec)
-    if not values or df.empty:
+    if not values:
         return _render_table(df, spec)
 
-    row = df.iloc[0]
+    row = _first_row_as_dict(df, values)
 
     if len(values) == 1:
         val = row[values[0]]
-        fig = go.Figure(go.Indicator(
-            mode="number",
-            value=float(val) if pd.notna(val) else 0,
-            title={"text": values[0], "font": {"size": 16, "family": PBI_FONT, "color": "#666666"}},
-            number={"font": {"size": 60, "family": PBI_FONT, "color": PBI_COLORS[0]},
-                    "valueformat": ",.0f"},
-        ))
-        fig.update_layout(
-            paper_bgcolor="white",
-            margin={"l": 30, "r": 30, "t": 60, "b": 30},
-        )
+        fig = go.Figure(data=[{
+            "type": "indicator",
+            "mode": "number",
+            "value": _safe_float(val),
+            "title": {"text": values[0], "font": _CARD_TITLE_FONT},
+            "number": {"font": {"size": 60, "family": PBI_FONT, "color": PBI_COLORS[0]},
+                       "valueformat": ",.0f"},
+        }], layout=_CARD_LAYOUT)
     else:
-        fig = make_subplots(
-            rows=1, cols=len(values),
-            specs=[[{"type": "indicator"}] * len(values)],
-        )
-        for i, v in enumerate(values):
+        traces = []
+        domains = _card_domains(len(values))
+        for v, color, (dom_x, dom_y) in zip(values, pbi_color_cycle(), domains):
             val = row[v]
-            fig.add_trace(go.Indicator(
-                mode="number",
-                value=float(val) if pd.notna(val) else 0,
-                title={"text": v, "font": {"size": 13, "family": PBI_FONT, "color": "#666666"}},
-                number={"font": {"size": 36, "family": PBI_FONT, "color": PBI_COLORS[i % len(PBI_COLORS)]},
-                        "valueformat": ",.0f"},
-            ), row=1, col=i + 1)
-        fig.update_layout(
-            paper_bgcolor="white",
-            margin={"l": 20, "r": 20, "t": 60, "b": 20},
-        )
+            traces.append({
+                "type": "indicator",
+                "mode": "number",
+                "value": _safe_float(val),
+                "title": {"text": v, "font": _MULTI_CARD_TITLE_FONT},
+                "number": {"font": {"size": 36, "family": PBI_FONT, "color": color},
+                           "valueformat": ",.0f"},
+                "domain": {"x": dom_x, "y": dom_y},
+            })
+        fig = go.Figure(data=traces, layout=_MULTI_CARD_LAYOUT)
 
     return fig
 
@@ -1241,23 +1624,27 @@ def _render_kpi(df, spec):
 
     First measure = value, second measure = reference (for delta calculation).
     """
+    import plotly.graph_objects as go
+
+    if df.empty:
+        return _render_table(df, spec)
     _, values = classify_columns(df, spec)
-    if not values or df.empty:
+    if not values:
         return _render_table(df, spec)
 
-    row = df.iloc[0]
-    value = float(row[values[0]]) if pd.notna(row[values[0]]) else 0
+    row = _first_row_as_dict(df, values[:2])
+    value = _safe_float(row[values[0]])
 
     indicator_kwargs = {
         "mode": "number+delta",
         "value": value,
-        "title": {"text": spec.visual_name, "font": {"size": 16, "family": PBI_FONT}},
+        "title": {"text": spec.visual_name, "font": _INDICATOR_TITLE_FONT},
         "number": {"font": {"size": 48, "family": PBI_FONT, "color": "#333333"},
                    "valueformat": ",.0f"},
     }
 
     if len(values) >= 2:
-        reference = float(row[values[1]]) if pd.notna(row[values[1]]) else 0
+        reference = _safe_float(row[values[1]])
         indicator_kwargs["delta"] = {
             "reference": reference,
             "relative": True,
@@ -1266,12 +1653,8 @@ def _render_kpi(df, spec):
             "decreasing": {"color": "#D64550"},
         }
 
-    fig = go.Figure(go.Indicator(**indicator_kwargs))
-    fig.update_layout(
-        paper_bgcolor="white",
-        font={"family": PBI_FONT},
-        margin={"l": 30, "r": 30, "t": 60, "b": 30},
-    )
+    fig = go.Figure(data=[{"type": "indicator", **indicator_kwargs}],
+                    layout=_INDICATOR_LAYOUT)
     return fig
 
 
@@ -1279,85 +1662,100 @@ def _render_kpi(df, spec):
 
 def _render_ribbon(df, spec):
     """Ribbon chart rendered as a stacked area chart (closest plotly equivalent)."""
+    import plotly.graph_objects as go
+
     categories, values = classify_columns(df, spec)
     if not categories or not values:
         return _render_table(df, spec)
 
-    df_sorted = df.sort_values(categories[0])
-    fig = go.Figure()
-
+    traces = []
     if len(categories) >= 2 and len(values) == 1:
-        pivot_df = df_sorted.pivot_table(
-            index=categories[0], columns=categories[1],
-            values=values[0], aggfunc="sum"
-        ).fillna(0)
-        for i, col in enumerate(pivot_df.columns):
-            fig.add_trace(go.Scatter(
-                x=pivot_df.index.astype(str), y=pivot_df[col],
-                name=str(col), mode="lines", stackgroup="one",
-                line={"color": PBI_COLORS[i % len(PBI_COLORS)]},
-            ))
+        # The pivot sorts the keys itself; a stable pre-sort would not change the sums
+        cat_labels, series_keys, grid = _pivot_grid(df, categories[0], categories[1], values[0])
+        for col, col_data, color in zip(series_keys, grid.T, pbi_color_cycle()):
+            traces.append({
+                "type": "scatter",
+                "x": cat_labels, "y": col_data,
+                "name": str(col), "mode": "lines", "stackgroup": "one",
+                "line": {"color": color},
+            })
     else:
-        cat_labels = df_sorted[categories[0]].astype(str).tolist()
-        for i, v in enumerate(values):
-            fig.add_trace(go.Scatter(
-                x=cat_labels, y=df_sorted[v].tolist(),
-                name=v, mode="lines", stackgroup="one",
-                line={"color": PBI_COLORS[i % len(PBI_COLORS)]},
-            ))
-
-    fig.update_layout(
-        **get_pbi_plotly_layout(),
-        title=spec.visual_name,
+        df_sorted = _sorted_by(df, categories[0], values)
+        cat_labels = _col_array(df_sorted, categories[0], as_str=True)
+        for v, color in zip(values, pbi_color_cycle()):
+            traces.append({
+                "type": "scatter",
+                "x": cat_labels, "y": _col_array(df_sorted, v),
+                "name": v, "mode": "lines", "stackgroup": "one",
+                "line": {"color": color},
+            })
+
+    fig = go.Figure(data=traces, layout=_chart_layout(
+        spec.visual_name,
         showlegend=True,
-    )
+    ))
     return fig
 
 
 # ---- Table (also used as fallback for unknown types) ----
 
+# Tables (plotly and native PPTX) show at most this many rows, striped
+# white/#F5F5F5. The plotly stripe list is built once and sliced per table:
+# go.Table clamps a short fill_color array to its last entry rather than
+# repeating it, so it needs one color per row.
+_TABLE_MAX_ROWS = 50
+_TABLE_ROW_COLORS = ("white", "#F5F5F5") * ((_TABLE_MAX_ROWS + 1) // 2)
+
+
 def _render_table(df, spec):
     """Table visual using go.Table. Also the fallback for unknown visual types.
 
     Renders up to 50 rows with PBI-styled header and alternating row colors.
     """
-    max_rows = 50
+    import numpy as np
+    import plotly.graph_objects as go
+
+    max_rows = _TABLE_MAX_ROWS
     display_df = df.head(max_rows)
     num_rows = len(display_df)
 
     header_values = list(display_df.columns)
-    cell_values = [display_df[col].astype(str).tolist() for col in display_df.columns]
+    # Plain integer columns go to plotly as-is (it prints them the same as
+    # str() would); everything else is cast so floats keep "1.0"/"nan"
+    cell_values = [
+        col.to_numpy() if isinstance(col.dtype, np.dtype) and col.dtype.kind in "iu"
+        else col.astype(str).to_numpy()
+        for _, col in display_df.items()
+    ]
 
-    # Build row color list matching exact row count
-    row_colors = ["white" if i % 2 == 0 else "#F5F5F5" for i in range(num_rows)]
+    row_colors = list(_TABLE_ROW_COLORS[:num_rows])
 
-    fig = go.Figure(go.Table(
-        header={
+    title = spec.visual_name
+    if len(df) > max_rows:
+        title += f" (showing {max_rows} of {len(df)} rows)"
+
+    fig = go.Figure(data=[{
+        "type": "table",
+        "header": {
             "values": [f"<b>{h}</b>" for h in header_values],
             "fill_color": PBI_COLORS[1],        # dark blue header
-            "font": {"color": "white", "size": 11, "family": PBI_FONT},
+            "font": _TABLE_HEADER_FONT,
             "align": "left",
             "height": 30,
         },
-        cells={
+        "cells": {
             "values": cell_values,
             "fill_color": [row_colors],
-            "font": {"size": 10, "family": PBI_FONT, "color": "#333333"},
+            "font": _TABLE_CELL_FONT,
             "align": "left",
             "height": 25,
         },
-    ))
-
-    title = spec.visual_name
-    if len(df) > max_rows:
-        title += f" (showing {max_rows} of {len(df)} rows)"
-
-    fig.update_layout(
-        title=title,
-        font={"family": PBI_FONT},
-        paper_bgcolor="white",
-        margin={"l": 10, "r": 10, "t": 50, "b": 10},
-    )
+    }], layout={
+        "title": {"text": title},
+        "font": {"family": PBI_FONT},
+        "paper_bgcolor": "white",
+        "margin": {"l": 10, "r": 10, "t": 50, "b": 10},
+    })
     return fig
 
 
@@ -1429,6 +1827,67 @@ SKIP_TYPES = {
     "scriptVisual", "pythonVisual", "paginator", "referenceLabel",
 }
 
+class _Dispatch(NamedTuple):
+    """Routing record for one visual type (see _DISPATCH)."""
+    renderer: Optional[Callable]  # CHART_TYPE_ROUTER entry; None if skipped/unknown
+    skip: bool                    # in SKIP_TYPES — not meaningful as a static chart
+    hundred: bool                 # 100% stacked (barnorm="percent")
+    stacked: bool                 # stacked bars/areas
+
+
+def _dispatch_flags(visual_type, renderer):
+    """_Dispatch for a rendered (non-skipped) visual type."""
+    return _Dispatch(renderer, False, "hundredPercent" in visual_type,
+                     "stacked" in visual_type.lower())
+
+
+# Resolved once per visual type so the per-chart path is a single dict lookup.
+# The keys are interned literals, and VisualSpec builders canonicalize
+# visual_type to them, so these lookups (and the NATIVE_* map checks) match
+# on identity.
+_DISPATCH = {vt: _dispatch_flags(vt, renderer) for vt, renderer in CHART_TYPE_ROUTER.items()}
+_DISPATCH.update((vt, _Dispatch(None, True, False, False)) for vt in SKIP_TYPES)
+
+# Lowercased visual type -> registered spelling, for callers that pass
+# "BarChart" or "piechart"
+_CANONICAL_TYPES = {vt.lower(): vt for vt in _DISPATCH}
+
+
+def _canonical_type(visual_type):
+    """Map a visual type onto its registered spelling (case-insensitive) so
+    every router and native-map lookup hits; unknown types are interned."""
+    if not isinstance(visual_type, str):
+        return visual_type
+    return _CANONICAL_TYPES.get(visual_type.lower()) or sys.intern(visual_type)
+
+
+def _dispatch(visual_type):
+    """Dispatch record for a visual type; unknown types get renderer None."""
+    rec = _DISPATCH.get(visual_type)
+    if rec is None:
+        rec = _dispatch_flags(visual_type, None)
+    return rec
+
+
+# =============================================================================
+# DICT RENDERERS (no plotly objects)
+# =============================================================================
+
+# Visual types whose figure dict is built without plotly objects, mapped to
+# the (horizontal, stacked) arguments of the shared _bars_figure_dict builder;
+# everything else converts its go.Figure
+_BAR_RENDERER_ARGS = {
+    _render_bar: (True, False),
+    _render_column: (False, False),
+    _render_stacked_bar: (True, True),
+    _render_stacked_column: (False, True),
+}
+_CHART_TYPE_ROUTER_DICT = {
+    vt: _BAR_RENDERER_ARGS[renderer]
+    for vt, renderer in CHART_TYPE_ROUTER.items()
+    if renderer in _BAR_RENDERER_ARGS
+}
+
 
 # =============================================================================
 # NATIVE PPTX CHART HELPERS
@@ -1453,6 +1912,8 @@ def _build_category_chart_data(df, categories, values, series=None):
     Returns:
         (CategoryChartData, num_series: int)
     """
+    from pptx.chart.data import CategoryChartData
+
     chart_data = CategoryChartData()
 
     # Sort category axis by calendar month order if applicable
@@ -1460,11 +1921,8 @@ def _build_category_chart_data(df, categories, values, series=None):
 
     # Well-aware: explicit Legend/Series column
     if series and len(series) == 1 and len(values) == 1 and categories:
-        pivot_df = df.pivot_table(
-            index=categories[0], columns=series[0],
-            values=values[0], aggfunc="sum"
-        ).fillna(0)
-        # Restore month order after pivot (pivot_table re-sorts index)
+        pivot_df = _sum_pivot(df, categories[0], series[0], values[0])
+        # Restore month order after pivot (the groupby re-sorts the index)
         month_keys = {v.lower(): i for v, i in _MONTH_ORDER.items()}
         idx_lower = [str(c).lower() for c in pivot_df.index]
         if all(v in month_keys for v in idx_lower):
@@ -1477,10 +1935,7 @@ def _build_category_chart_data(df, categories, values, series=None):
 
     if len(categories) >= 2 and len(values) == 1:
         # Legacy: pivot second grouping column into series
-        pivot_df = df.pivot_table(
-            index=categories[0], columns=categories[1],
-            values=values[0], aggfunc="sum"
-        ).fillna(0)
+        pivot_df = _sum_pivot(df, categories[0], categories[1], values[0])
         idx_lower = [str(c).lower() for c in pivot_df.index]
         if all(v in _MONTH_ORDER for v in idx_lower):
             pivot_df = pivot_df.iloc[sorted(range(len(pivot_df)),
@@ -1490,7 +1945,7 @@ def _build_category_chart_data(df, categories, values, series=None):
             chart_data.add_series(str(col), pivot_df[col].tolist())
         return chart_data, len(pivot_df.columns)
     else:
-        chart_data.categories = df[categories[0]].astype(str).tolist()
+        chart_data.categories = _str_labels(df[categories[0]])
         for v in values:
             chart_data.add_series(v, df[v].fillna(0).tolist())
         return chart_data, len(values)
@@ -1502,28 +1957,28 @@ def _build_xy_chart_data(df, spec):
     Returns:
         (XyChartData, num_series: int) or (None, 0) if insufficient data
     """
+    from pptx.chart.data import XyChartData
+
     categories, values = classify_columns(df, spec)
     chart_data = XyChartData()
 
     if len(values) < 2:
         return None, 0
 
+    # Points come from the two measure columns directly rather than a
+    # per-row Series out of iterrows
     num_series = 0
     if categories:
         groups = df.groupby(categories[0])
         for name, group in groups:
             series = chart_data.add_series(str(name))
-            for _, row in group.iterrows():
-                x_val = float(row[values[0]]) if pd.notna(row[values[0]]) else 0
-                y_val = float(row[values[1]]) if pd.notna(row[values[1]]) else 0
-                series.add_data_point(x_val, y_val)
+            for x_val, y_val in zip(group[values[0]].tolist(), group[values[1]].tolist()):
+                series.add_data_point(_safe_float(x_val), _safe_float(y_val))
             num_series += 1
     else:
         series = chart_data.add_series("Data")
-        for _, row in df.iterrows():
-            x_val = float(row[values[0]]) if pd.notna(row[values[0]]) else 0
-            y_val = float(row[values[1]]) if pd.notna(row[values[1]]) else 0
-            series.add_data_point(x_val, y_val)
+        for x_val, y_val in zip(df[values[0]].tolist(), df[values[1]].tolist()):
+            series.add_data_point(_safe_float(x_val), _safe_float(y_val))
         num_series = 1
 
     return chart_data, num_series
@@ -1667,10 +2122,10 @@ def _style_native_chart(chart, spec, num_series, categories=None, values=None,
     label_pos = _label_pos_map.get(spec.visual_type)
 
     plot = chart.plots[0]
-    for i, series in enumerate(plot.series):
+    for series, rgb in zip(plot.series, pbi_color_cycle(PBI_RGB_COLORS)):
         fill = series.format.fill
         fill.solid()
-        fill.fore_color.rgb = PBI_RGB_COLORS[i % len(PBI_RGB_COLORS)]
+        fill.fore_color.rgb = rgb
         # Data labels — show value for bar/column/scatter; suppress for line/area
         # (line charts with many points get very cluttered with per-point labels)
         _no_label_types = ("lineChart", "areaChart", "stackedAreaChart",
@@ -1752,6 +2207,8 @@ def _add_native_chart(slide, df, spec, left=None, top=None, width=None, height=N
     if chart_type_enum is None:
         return False
 
+    from pptx.chart.data import CategoryChartData
+
     c_left = left if left is not None else CHART_LEFT
     c_top = top if top is not None else CHART_TOP
     c_width = width if width is not None else CHART_WIDTH
@@ -1785,11 +2242,7 @@ def _add_native_chart(slide, df, spec, left=None, top=None, width=None, height=N
         if not categories and len(values) >= 2:
             chart_data = CategoryChartData()
             chart_data.categories = values
-            row = df.iloc[0]
-            chart_data.add_series(
-                "Values",
-                [float(row[v]) if pd.notna(row[v]) else 0 for v in values]
-            )
+            chart_data.add_series("Values", _first_row_floats(df, values))
             chart_frame = slide.shapes.add_chart(
                 chart_type_enum, c_left, c_top, c_width, c_height,
                 chart_data
@@ -1798,9 +2251,9 @@ def _add_native_chart(slide, df, spec, left=None, top=None, width=None, height=N
             _style_native_chart(chart, spec, 1, show_title=show_title)
             # Color individual pie/donut slices
             plot = chart.plots[0]
-            for i, point in enumerate(plot.series[0].points):
+            for point, rgb in zip(plot.series[0].points, pbi_color_cycle(PBI_RGB_COLORS)):
                 point.format.fill.solid()
-                point.format.fill.fore_color.rgb = PBI_RGB_COLORS[i % len(PBI_RGB_COLORS)]
+                point.format.fill.fore_color.rgb = rgb
             return True
 
     if not categories or not values:
@@ -1832,9 +2285,9 @@ def _add_native_chart(slide, df, spec, left=None, top=None, width=None, height=N
     # Pie/donut: color individual slices instead of series
     if spec.visual_type in ("pieChart", "donutChart"):
         plot = chart.plots[0]
-        for i, point in enumerate(plot.series[0].points):
+        for point, rgb in zip(plot.series[0].points, pbi_color_cycle(PBI_RGB_COLORS)):
             point.format.fill.solid()
-            point.format.fill.fore_color.rgb = PBI_RGB_COLORS[i % len(PBI_RGB_COLORS)]
+            point.format.fill.fore_color.rgb = rgb
 
     return True
 
@@ -1860,6 +2313,8 @@ def _format_cell_value(value, col_name=""):
     Detects currency and percentage patterns from column name keywords
     and applies human-readable formatting.
     """
+    import pandas as pd
+
     if pd.isna(value) or str(value).strip() in ("", "(Blank)"):
         return ""
     col_lower = col_name.lower()
@@ -1894,6 +2349,10 @@ def _format_cell_value(value, col_name=""):
         return str(value)
 
 
+_NATIVE_ROW_RGB = (RGBColor(0xFF, 0xFF, 0xFF), RGBColor(0xF5, 0xF5, 0xF5))
+_NATIVE_CELL_TEXT_RGB = RGBColor(0x33, 0x33, 0x33)
+
+
 def _add_native_table(slide, df, spec, left=None, top=None, width=None, height=None,
                       show_title=True):
     """Add a native editable PowerPoint table to the slide.
@@ -1904,7 +2363,7 @@ def _add_native_table(slide, df, spec, left=None, top=None, width=None, height=N
     Returns:
         True if table was added successfully.
     """
-    max_rows = 50
+    max_rows = _TABLE_MAX_ROWS
     display_df = df.head(max_rows)
     num_rows = len(display_df)
     num_cols = len(display_df.columns)
@@ -1960,17 +2419,18 @@ def _add_native_table(slide, df, spec, left=None, top=None, width=None, height=N
         cell_fill.solid()
         cell_fill.fore_color.rgb = PBI_RGB_COLORS[1]  # #12239E
 
-    # Data rows — alternating white/#F5F5F5
-    for i in range(num_rows):
-        row_color = RGBColor(0xFF, 0xFF, 0xFF) if i % 2 == 0 else RGBColor(0xF5, 0xF5, 0xF5)
-        for j, col_name in enumerate(display_df.columns):
+    # Data rows — alternating white/#F5F5F5. Values come from one object
+    # grid rather than a display_df.iloc[i, j] lookup per cell.
+    grid = display_df.to_numpy(dtype=object)
+    col_names = list(display_df.columns)
+    for i, (row_values, row_color) in enumerate(zip(grid, cycle(_NATIVE_ROW_RGB))):
+        for j, (raw_val, col_name) in enumerate(zip(row_values, col_names)):
             cell = table.cell(i + 1, j)
-            raw_val = display_df.iloc[i, j]
             cell.text = _format_cell_value(raw_val, col_name)
             p = cell.text_frame.paragraphs[0]
             p.font.size = Pt(9)
             p.font.name = PBI_FONT
-            p.font.color.rgb = RGBColor(0x33, 0x33, 0x33)
+            p.font.color.rgb = _NATIVE_CELL_TEXT_RGB
             # Row fill
             cell_fill = cell.fill
             cell_fill.solid()
@@ -1989,11 +2449,13 @@ def _add_native_card(slide, df, spec, left=None, top=None, width=None, height=No
     Returns:
         True if card was added successfully.
     """
+    if df.empty:
+        return False
     _, values = classify_columns(df, spec)
-    if not values or df.empty:
+    if not values:
         return False
 
-    row = df.iloc[0]
+    row = _first_row_as_dict(df, values)
     c_left = left if left is not None else CHART_LEFT
     c_top = top if top is not None else CHART_TOP
     c_width = width if width is not None else CHART_WIDTH
@@ -2003,7 +2465,7 @@ def _add_native_card(slide, df, spec, left=None, top=None, width=None, height=No
     card_width = int(c_width / num_cards)
     card_padding = Inches(0.2)
 
-    for i, v in enumerate(values):
+    for i, (v, rgb) in enumerate(zip(values, pbi_color_cycle(PBI_RGB_COLORS))):
         val = row[v]
         formatted = _format_cell_value(val, v)
 
@@ -2024,7 +2486,7 @@ def _add_native_card(slide, df, spec, left=None, top=None, width=None, height=No
         font_size = 60 if num_cards == 1 else (44 if num_cards <= 2 else 32)
         p.font.size = Pt(font_size)
         p.font.name = PBI_FONT
-        p.font.color.rgb = PBI_RGB_COLORS[i % len(PBI_RGB_COLORS)]
+        p.font.color.rgb = rgb
         p.font.bold = True
 
         # Label text box — measure name below
@@ -2064,17 +2526,19 @@ def _add_native_kpi(slide, df, spec, left=None, top=None, width=None, height=Non
     Returns:
         True if KPI was added successfully.
     """
+    if df.empty:
+        return False
     _, values = classify_columns(df, spec)
-    if not values or df.empty:
+    if not values:
         return False
 
-    row = df.iloc[0]
+    row = _first_row_as_dict(df, values[:2])
     c_left = left if left is not None else CHART_LEFT
     c_top = top if top is not None else CHART_TOP
     c_width = width if width is not None else CHART_WIDTH
     c_height = height if height is not None else CHART_HEIGHT
 
-    value = float(row[values[0]]) if pd.notna(row[values[0]]) else 0
+    value = _safe_float(row[values[0]])
     formatted_value = _format_cell_value(value, values[0])
 
     # Title
@@ -2103,7 +2567,7 @@ def _add_native_kpi(slide, df, spec, left=None, top=None, width=None, height=Non
 
     # Delta indicator (if second measure exists)
     if len(values) >= 2:
-        reference = float(row[values[1]]) if pd.notna(row[values[1]]) else 0
+        reference = _safe_float(row[values[1]])
         delta = value - reference
         if reference != 0:
             delta_pct = delta / abs(reference) * 100
@@ -2151,26 +2615,25 @@ def _add_native_ribbon(slide, df, spec, left=None, top=None, width=None, height=
     if not categories or not values:
         return False
 
+    from pptx.chart.data import CategoryChartData
+
     c_left = left if left is not None else CHART_LEFT
     c_top = top if top is not None else CHART_TOP
     c_width = width if width is not None else CHART_WIDTH
     c_height = height if height is not None else CHART_HEIGHT
 
-    df_sorted = df.sort_values(categories[0])
     chart_data = CategoryChartData()
 
     if len(categories) >= 2 and len(values) == 1:
-        # Pivot second grouping into series
-        pivot_df = df_sorted.pivot_table(
-            index=categories[0], columns=categories[1],
-            values=values[0], aggfunc="sum"
-        ).fillna(0)
+        # Pivot second grouping into series (groupby sorts the keys itself)
+        pivot_df = _sum_pivot(df, categories[0], categories[1], values[0])
         chart_data.categories = [str(c) for c in pivot_df.index]
         num_series = len(pivot_df.columns)
         for col in pivot_df.columns:
             chart_data.add_series(str(col), pivot_df[col].tolist())
     else:
-        chart_data.categories = df_sorted[categories[0]].astype(str).tolist()
+        df_sorted = _sorted_by(df, categories[0], values)
+        chart_data.categories = _str_labels(df_sorted[categories[0]])
         num_series = len(values)
         for v in values:
             chart_data.add_series(v, df_sorted[v].tolist())
@@ -2205,6 +2668,8 @@ def _add_native_combo(slide, df, spec, left=None, top=None, width=None, height=N
     if not categories or not values:
         return False
 
+    from pptx.chart.data import CategoryChartData
+
     c_left = left if left is not None else CHART_LEFT
     c_top = top if top is not None else CHART_TOP
     c_width = width if width is not None else CHART_WIDTH
@@ -2221,35 +2686,19 @@ def _add_native_combo(slide, df, spec, left=None, top=None, width=None, height=N
     if len(values) < 2:
         return False
 
-    # Resolve y2 measures (secondary axis = line)
-    df_cols_lower = {c.lower().strip(): c for c in df.columns}
-    y2_actual = set()
-    for y2 in spec.y2_columns:
-        actual = df_cols_lower.get(y2.lower().strip())
-        if actual:
-            y2_actual.add(actual)
-
-    if y2_actual:
-        bar_measures = [v for v in values if v not in y2_actual]
-        line_measures = [v for v in values if v in y2_actual]
-    elif len(values) > 1:
-        bar_measures = values[:-1]
-        line_measures = [values[-1]]
-    else:
-        bar_measures = values
-        line_measures = []
+    bar_measures, line_measures = _split_combo_measures(df, spec, values)
 
     if not line_measures:
         return False  # No secondary axis — use regular column chart
 
     # Determine base chart type based on visual type
-    is_stacked = "stacked" in spec.visual_type.lower()
+    is_stacked = _dispatch(spec.visual_type).stacked
     base_chart_type = XL_CHART_TYPE.COLUMN_STACKED if is_stacked else XL_CHART_TYPE.COLUMN_CLUSTERED
 
     # Build chart data with ALL measures (bars first, then lines)
     all_measures = bar_measures + line_measures
     chart_data = CategoryChartData()
-    cat_labels = df[categories[0]].astype(str).tolist()
+    cat_labels = _str_labels(df[categories[0]])
     chart_data.categories = cat_labels
     for m in all_measures:
         vals = df[m].fillna(0).tolist()
@@ -2363,9 +2812,8 @@ def _add_native_combo(slide, df, spec, left=None, top=None, width=None, height=N
     # Re-color line series (they were moved, so reapply from chart object)
     # The line series colors need to be set via XML since they're in a separate plot
     line_sers = line_chart_el.findall('c:ser', nsmap)
-    for i, ser in enumerate(line_sers):
-        color_idx = (len(bar_measures) + i) % len(PBI_RGB_COLORS)
-        rgb = PBI_RGB_COLORS[color_idx]
+    line_rgbs = islice(pbi_color_cycle(PBI_RGB_COLORS), len(bar_measures), None)
+    for ser, rgb in zip(line_sers, line_rgbs):
         hex_color = f"{rgb[0]:02X}{rgb[1]:02X}{rgb[2]:02X}"
 
         # Set line color via spPr
@@ -2394,6 +2842,14 @@ NATIVE_EXTENDED_MAP = {
     "lineStackedColumnComboChart": _add_native_combo,
 }
 
+# visual_type -> (NATIVE_CHART_MAP enum, NATIVE_EXTENDED_MAP renderer), either
+# None — one lookup picks the native path(s) generate_chart_pptx tries.
+_PPTX_DISPATCH = {
+    vt: (NATIVE_CHART_MAP.get(vt), NATIVE_EXTENDED_MAP.get(vt))
+    for vt in NATIVE_CHART_MAP.keys() | NATIVE_EXTENDED_MAP.keys()
+}
+_NO_NATIVE = (None, None)  # PNG fallback only
+
 
 # =============================================================================
 # CORE API
@@ -2409,20 +2865,20 @@ def _build_spec(spec, visual_type, visual_name, grouping_columns,
     return VisualSpec(
         page_name=page_name or "",
         visual_name=visual_name or "",
-        visual_type=visual_type,
-        grouping_columns=grouping_columns or [],
-        measure_columns=measure_columns or [],
-        y2_columns=y2_columns or [],
+        visual_type=_canonical_type(visual_type),
+        grouping_columns=tuple(grouping_columns or ()),
+        measure_columns=tuple(measure_columns or ()),
+        y2_columns=tuple(y2_columns or ()),
     )
 
 
 def generate_chart(df, spec=None, visual_type=None, visual_name=None,
                    grouping_columns=None, measure_columns=None,
-                   y2_columns=None, page_name=""):
+                   y2_columns=None, page_name="", as_dict=False):
     """Generate a plotly Figure for a PBI visual from tabular data.
 
-    This is the programmatic API for plotly/PNG output. Always returns a
-    plotly Figure (or None). For PowerPoint output, use generate_chart_pptx().
+    This is the programmatic API for plotly/PNG output. Returns a plotly
+    Figure (or None). For PowerPoint output, use generate_chart_pptx().
 
     Args:
         df: DataFrame with DAX query results
@@ -2433,33 +2889,54 @@ def generate_chart(df, spec=None, visual_type=None, visual_name=None,
         measure_columns: list of value/measure column names
         y2_columns: list of secondary-axis measure column names
         page_name: PBI page name (informational)
+        as_dict: return a JSON-serializable figure dict instead of a Figure.
+            Bar/column types build the dict directly without plotly objects;
+            other types convert their Figure. Either way the dict is passed
+            through plotly's JSON encoder, so json.dumps() accepts it. Numeric
+            arrays from a Figure may use plotly's typed-array form
+            ({"dtype", "bdata"}), which go.Figure and plotly.js read as-is.
 
     Returns:
-        plotly Figure object, or None if visual type should be skipped
+        plotly Figure object (or dict with as_dict=True), or None if visual
+        type should be skipped
     """
     spec = _build_spec(spec, visual_type, visual_name, grouping_columns,
                        measure_columns, y2_columns, page_name)
 
-    if spec.visual_type in SKIP_TYPES:
-        print(f"  Skipping: {spec.visual_name} ({spec.visual_type}) "
-              f"-- not meaningful as static chart")
+    dispatch = _dispatch(spec.visual_type)
+    renderer = dispatch.renderer
+    if dispatch.skip:
+        logger.debug("Skipping: %s (%s) -- not meaningful as static chart",
+                     spec.visual_name, spec.visual_type)
         return None
 
     if df is None or df.empty:
-        print(f"  Skipping: {spec.visual_name} -- no data")
+        logger.debug("Skipping: %s -- no data", spec.visual_name)
         return None
 
-    renderer = CHART_TYPE_ROUTER.get(spec.visual_type)
     if renderer is None:
-        print(f"  WARNING: Unknown visual type '{spec.visual_type}' for "
-              f"'{spec.visual_name}' -- rendering as table fallback")
+        logger.warning("Unknown visual type '%s' for '%s' -- rendering as table fallback",
+                       spec.visual_type, spec.visual_name)
         renderer = _render_table
+    df = _categorize_groupings(df, spec)
     try:
-        fig = renderer(df, spec)
-        print(f"  Generated: {spec.visual_name} ({spec.visual_type})")
+        fig = None
+        if as_dict:
+            bar_args = _CHART_TYPE_ROUTER_DICT.get(spec.visual_type)
+            if bar_args is not None:
+                fig = _bars_figure_dict(df, spec, *bar_args)
+        if fig is None:
+            fig = renderer(df, spec)
+        if as_dict:
+            import plotly.io as pio
+
+            # Both paths carry ndarrays (and NaN); plotly's encoder turns them
+            # into JSON lists/null, so the result survives json.dumps()
+            fig = json.loads(pio.to_json(fig, validate=False))
+        logger.debug("Generated: %s (%s)", spec.visual_name, spec.visual_type)
         return fig
     except Exception as e:
-        print(f"  ERROR generating chart for '{spec.visual_name}': {e}")
+        logger.error("Error generating chart for '%s': %s", spec.visual_name, e)
         return None
 
 
@@ -2488,13 +2965,15 @@ def generate_chart_pptx(df, spec=None, visual_type=None, visual_name=None,
     spec = _build_spec(spec, visual_type, visual_name, grouping_columns,
                        measure_columns, y2_columns, page_name)
 
-    if spec.visual_type in SKIP_TYPES:
-        print(f"  Skipping: {spec.visual_name} ({spec.visual_type}) "
-              f"-- not meaningful as static chart")
+    dispatch = _dispatch(spec.visual_type)
+    renderer = dispatch.renderer
+    if dispatch.skip:
+        logger.debug("Skipping: %s (%s) -- not meaningful as static chart",
+                     spec.visual_name, spec.visual_type)
         return None
 
     if df is None or df.empty:
-        print(f"  Skipping: {spec.visual_name} -- no data")
+        logger.debug("Skipping: %s -- no data", spec.visual_name)
         return None
 
     try:
@@ -2502,68 +2981,143 @@ def generate_chart_pptx(df, spec=None, visual_type=None, visual_name=None,
         blank_layout = prs.slide_layouts[6]  # blank slide layout
         slide = prs.slides.add_slide(blank_layout)
 
+        native_type, extended_fn = _PPTX_DISPATCH.get(spec.visual_type, _NO_NATIVE)
+
         # Try native chart first for standard chart types (bar, column, line, etc.)
-        if spec.visual_type in NATIVE_CHART_MAP:
+        if native_type is not None:
             success = _add_native_chart(slide, df, spec)
             if success:
-                print(f"  Generated (native PPTX): {spec.visual_name} ({spec.visual_type})")
+                logger.debug("Generated (native PPTX): %s (%s)", spec.visual_name, spec.visual_type)
                 return prs
-            print(f"  Native chart failed for '{spec.visual_name}', trying extended...")
+            logger.debug("Native chart failed for '%s', trying extended...", spec.visual_name)
 
         # Try extended native renderers (table, card, KPI, ribbon, combo)
-        if spec.visual_type in NATIVE_EXTENDED_MAP:
-            renderer_fn = NATIVE_EXTENDED_MAP[spec.visual_type]
-            success = renderer_fn(slide, df, spec)
+        if extended_fn is not None:
+            success = extended_fn(slide, df, spec)
             if success:
-                print(f"  Generated (native PPTX): {spec.visual_name} ({spec.visual_type})")
+                logger.debug("Generated (native PPTX): %s (%s)", spec.visual_name, spec.visual_type)
                 return prs
-            print(f"  Extended native failed for '{spec.visual_name}', using PNG fallback")
+            logger.debug("Extended native failed for '%s', using PNG fallback", spec.visual_name)
 
         # PNG fallback: render with plotly, insert image on slide
-        renderer = CHART_TYPE_ROUTER.get(spec.visual_type)
         if renderer is None:
-            print(f"  WARNING: Unknown visual type '{spec.visual_type}' for "
-                  f"'{spec.visual_name}' -- rendering as table fallback")
+            logger.warning("Unknown visual type '%s' for '%s' -- rendering as table fallback",
+                           spec.visual_type, spec.visual_name)
             renderer = _render_table
 
         fig = renderer(df, spec)
         with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
             tmp_path = tmp.name
         try:
-            fig.write_image(tmp_path, format="png", width=1100, height=500, scale=2)
+            Path(tmp_path).write_bytes(_png_bytes(fig))
             _add_png_to_slide(slide, tmp_path)
         finally:
             os.unlink(tmp_path)
 
-        print(f"  Generated (PNG fallback on PPTX): {spec.visual_name} ({spec.visual_type})")
+        logger.debug("Generated (PNG fallback on PPTX): %s (%s)", spec.visual_name, spec.visual_type)
         return prs
 
     except Exception as e:
-        print(f"  ERROR generating chart for '{spec.visual_name}': {e}")
+        logger.error("Error generating chart for '%s': %s", spec.visual_name, e)
         return None
 
 
-def save_chart(fig, output_path, width=1100, height=500, scale=2):
-    """Save a plotly Figure as a PNG image.
+@lru_cache(maxsize=None)
+def _start_kaleido_server():
+    """Start kaleido's persistent Chromium once per process.
+
+    Without it, kaleido>=1 launches a browser for every image. Older kaleido
+    keeps its own persistent scope, and a missing kaleido or browser is
+    reported by to_image itself — all of these fall through to the per-call path.
+    """
+    try:
+        import kaleido
+        kaleido.start_sync_server(silence_warnings=True)
+    except Exception:
+        return False
+    atexit.register(kaleido.stop_sync_server, silence_warnings=True)
+    return True
+
+
+def _png_bytes(fig, width=1100, height=500, scale=2):
+    """Render a plotly Figure to PNG bytes through the shared kaleido server."""
+    import plotly.io as pio
+
+    _start_kaleido_server()
+    return pio.to_image(fig, format="png", width=width, height=height, scale=scale)
+
+
+def save_chart(fig, output_path, width=1100, height=500, scale=2, cache_dir=None):
+    """Save a plotly Figure (or figure dict) as a PNG image.
+
+    With cache_dir, PNGs are content-addressed by the figure JSON plus the
+    image size, so re-exporting an unchanged visual copies the cached file
+    instead of rasterizing it again.
 
     Args:
-        fig: plotly Figure object
+        fig: plotly Figure object or figure dict
         output_path: file path for the PNG (directory is created if needed)
         width: image width in pixels (before scaling)
         height: image height in pixels (before scaling)
         scale: resolution multiplier (2 = 144 DPI, 3 = 216 DPI)
+        cache_dir: Directory for cached PNGs. None disables the cache.
     """
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    fig.write_image(
-        str(output_path),
-        format="png",
-        width=width,
-        height=height,
-        scale=scale,
-    )
-    print(f"  Saved: {output_path}")
+    if not cache_dir:
+        output_path.write_bytes(_png_bytes(fig, width, height, scale))
+        logger.debug("Saved: %s", output_path)
+        return
+
+    import plotly.io as pio
+
+    # pio.to_json takes both a Figure and a figure dict (generate_chart(as_dict=True))
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(pio.to_json(fig, validate=False).encode("utf-8"))
+    digest.update(f"|{width}x{height}@{scale}".encode("utf-8"))
+    cache_path = Path(cache_dir) / f"{digest.hexdigest()}.png"
+
+    try:
+        png = cache_path.read_bytes()
+    except OSError:
+        png = None
+    # Only complete PNGs count as hits; anything else is re-rendered and replaced
+    if png and png.startswith(_PNG_SIGNATURE) and png.endswith(_PNG_TRAILER):
+        output_path.write_bytes(png)
+        logger.debug("Saved (cached): %s", output_path)
+        return
+
+    png = _png_bytes(fig, width, height, scale)
+    output_path.write_bytes(png)
+    try:
+        _write_cache_file(cache_path, png)
+    except OSError as e:
+        logger.warning("Could not write chart cache %s: %s", cache_path, e)
+    logger.debug("Saved: %s", output_path)
+
+
+# First bytes and closing IEND chunk of every PNG file
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_PNG_TRAILER = b"IEND\xaeB`\x82"
+
+
+def _write_cache_file(cache_path, data):
+    """Write data to cache_path atomically.
+
+    The bytes go to a temp file in the same directory, which is then renamed
+    over cache_path, so concurrent writers and interrupted runs never
+    leave a partial entry behind.
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp",
+                                     delete=False) as tmp:
+        tmp.write(data)
+    try:
+        os.replace(tmp.name, cache_path)
+    except OSError:
+        os.unlink(tmp.name)
+        raise
 
 
 def save_chart_pptx(prs, output_path):
@@ -2576,13 +3130,63 @@ def save_chart_pptx(prs, output_path):
     output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     prs.save(str(output_path))
-    print(f"  Saved: {output_path}")
+    logger.debug("Saved: %s", output_path)
 
 
 # =============================================================================
 # CLI
 # =============================================================================
 
+def _read_csv(csv_path):
+    """Load a DAX result CSV into a DataFrame.
+
+    pd.read_csv is the only reader on purpose: an Arrow-based reader infers
+    ISO dates as timestamps and reads empty text cells as "", so chart labels
+    and column classification would depend on whether pyarrow is installed.
+    """
+    import pandas as pd
+
+    return pd.read_csv(csv_path, encoding="utf-8-sig")
+
+
+def _parse_field_args(fields):
+    """Split 'name:role' field strings into grouping, measure and y2 lists.
+
+    Roles are 'grouping', 'measure' or 'y2' (case-insensitive); y2 fields are
+    measures on the secondary axis, so they land in both measure and y2 lists.
+    Unknown roles are warned about and skipped.
+
+    Returns:
+        (grouping_cols, measure_cols, y2_cols)
+
+    Raises:
+        ValueError: if a field has no ':role' suffix.
+    """
+    grouping_cols = []
+    measure_cols = []
+    y2_cols = []
+    by_role = {
+        "grouping": (grouping_cols,),
+        "measure": (measure_cols,),
+        "y2": (measure_cols, y2_cols),
+    }
+    for field_str in fields:
+        name, sep, role = field_str.rpartition(":")
+        if not sep:
+            raise ValueError(f"Field '{field_str}' must be in 'name:role' format "
+                             f"(e.g., 'Revenue:measure')")
+        name = name.strip()
+        role = role.strip().lower()
+        targets = by_role.get(role)
+        if targets is None:
+            print(f"WARNING: Unknown role '{role}' for field '{name}' "
+                  f"-- expected 'measure', 'grouping', or 'y2'")
+            continue
+        for cols in targets:
+            cols.append(name)
+    return grouping_cols, measure_cols, y2_cols
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="PBI AutoGov -- Chart Generator (Skill 5): "
@@ -2626,14 +3230,23 @@ def main():
                         help="Resolution scale factor for PNG mode (default: 2 for 144 DPI)")
 
     args = parser.parse_args()
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(levelname)s: %(message)s"))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
 
     # Load CSV data
-    csv_path = Path(args.csv)
-    if not csv_path.exists():
+    csv_path = args.csv
+    try:
+        csv_size = os.stat(csv_path).st_size  # the one stat: existence check + size
+    except OSError:
         print(f"ERROR: CSV file not found: {csv_path}")
         sys.exit(1)
-    df = pd.read_csv(csv_path, encoding="utf-8-sig")
-    print(f"Loaded CSV: {csv_path} ({len(df)} rows, {len(df.columns)} columns)")
+    df = _read_csv(csv_path)
+    _df_column_maps(df)  # build the column lookup once; classify/resolve reuse it
+    print(f"Loaded CSV: {csv_path} ({csv_size:,} bytes, {len(df)} rows, "
+          f"{len(df.columns)} columns)")
 
     # Determine mode and build VisualSpec
     if args.metadata and args.visual:
@@ -2645,36 +3258,19 @@ def main():
     elif args.visual_type and args.fields:
         # Mode 2: Manual CLI-driven (ad-hoc usage)
         print(f"Mode 2: Using CLI-provided visual metadata")
-        grouping_cols = []
-        measure_cols = []
-        y2_cols = []
-        for field_str in args.fields:
-            if ":" not in field_str:
-                print(f"ERROR: Field '{field_str}' must be in 'name:role' format "
-                      f"(e.g., 'Revenue:measure')")
-                sys.exit(1)
-            name, role = field_str.rsplit(":", 1)
-            name = name.strip()
-            role = role.strip().lower()
-            if role == "measure":
-                measure_cols.append(name)
-            elif role == "grouping":
-                grouping_cols.append(name)
-            elif role == "y2":
-                # y2 fields are measures on the secondary axis
-                measure_cols.append(name)
-                y2_cols.append(name)
-            else:
-                print(f"WARNING: Unknown role '{role}' for field '{name}' "
-                      f"-- expected 'measure', 'grouping', or 'y2'")
+        try:
+            grouping_cols, measure_cols, y2_cols = _parse_field_args(args.fields)
+        except ValueError as e:
+            print(f"ERROR: {e}")
+            sys.exit(1)
 
         spec = VisualSpec(
             page_name="",
             visual_name=args.visual_name or args.visual_type,
-            visual_type=args.visual_type,
-            grouping_columns=grouping_cols,
-            measure_columns=measure_cols,
-            y2_columns=y2_cols,
+            visual_type=_canonical_type(args.visual_type),
+            grouping_columns=tuple(grouping_cols),
+            measure_columns=tuple(measure_cols),
+            y2_columns=tuple(y2_cols),
         )
     else:
         print("ERROR: Provide either --metadata + --visual (Mode 1) "
@@ -2684,17 +3280,17 @@ def main():
 
     print(f"\nVisual: {spec.visual_name}")
     print(f"  Type: {spec.visual_type}")
-    print(f"  Grouping columns: {spec.grouping_columns}")
-    print(f"  Measure columns: {spec.measure_columns}")
+    print(f"  Grouping columns: {list(spec.grouping_columns)}")
+    print(f"  Measure columns: {list(spec.measure_columns)}")
     if spec.y2_columns:
-        print(f"  Y2 columns (secondary axis): {spec.y2_columns}")
+        print(f"  Y2 columns (secondary axis): {list(spec.y2_columns)}")
 
     # Sanitize visual name for filename: replace non-alphanumeric chars with underscore
-    safe_name = re.sub(r'[^\w\-]', '_', spec.visual_name).strip('_')
+    safe_name = _FNAME_SANITIZE_RE.sub('_', spec.visual_name).strip('_')
     output_dir = Path(args.output)
     # Create report subfolder if --report-name provided
     if args.report_name:
-        safe_report = re.sub(r'[^\w\-]', '_', args.report_name).strip('_')
+        safe_report = _FNAME_SANITIZE_RE.sub('_', args.report_name).strip('_')
         output_dir = output_dir / safe_report
 
     # Generate and save chart
@@ -15,11 +15,20 @@ Output: pbi_report_metadata.xlsx
 import argparse
 import json
 import re
+import sys
 from pathlib import Path
 from collections import Counter
+from functools import lru_cache
 
 import pandas as pd
 
+# xlsxwriter is optional — a faster write-only Excel engine; openpyxl is the fallback
+try:
+    import xlsxwriter  # noqa: F401
+    HAS_XLSXWRITER = True
+except ImportError:
+    HAS_XLSXWRITER = False
+
 from tmdl_parser import parse_semantic_model
 from bookmark_parser import parse_bookmarks, extract_single_filter
 
@@ -167,14 +176,15 @@ def get_well_name(role: str) -> str:
     return WELL_NAME_MAP.get(role, role)
 
 
+@lru_cache(maxsize=512)
 def get_usage_label(vis_type: str, role: str, is_measure: bool) -> str:
     """Determine the usage label for a field based on visual type, role, and measure status."""
     base = ROLE_USAGE_MAP.get((vis_type, role))
     if not base:
         base = DEFAULT_ROLE_MAP.get(role, f"Visual {role}")
     if is_measure:
-        return f"{base}, Filter (Measure)"
-    return base
+        return sys.intern(f"{base}, Filter (Measure)")
+    return sys.intern(base)
 
 
 # ============================================================
@@ -232,6 +242,14 @@ def extract_field_info(field: dict) -> list[dict]:
 
             results.append({"entity": entity, "property": prop, "field_type": "HierarchyLevel"})
 
+    # Table/column names repeat across every visual that uses them — intern them so
+    # all metadata rows share one string object per name.
+    for fi in results:
+        if isinstance(fi["entity"], str):
+            fi["entity"] = sys.intern(fi["entity"])
+        if isinstance(fi["property"], str):
+            fi["property"] = sys.intern(fi["property"])
+
     return results
 
 
@@ -375,8 +393,12 @@ def get_measure_source_tables(entity: str, prop: str, measures_lookup: dict) ->
 # Visual parser
 # ============================================================
 
+@lru_cache(maxsize=128)
 def get_visual_display_name(vis_type: str) -> str:
-    """Convert camelCase visual type to human-readable name."""
+    """Convert camelCase visual type to human-readable name.
+
+    Cached — a report has only a few dozen distinct visual types.
+    """
     if vis_type in VISUAL_TYPE_DISPLAY:
         return VISUAL_TYPE_DISPLAY[vis_type]
     name = re.sub(r"([A-Z])", r" \1", vis_type).strip()
@@ -748,9 +770,30 @@ def _extract_slicer_selection(vis: dict, page_name: str,
 # Main extraction function
 # ============================================================
 
+# Output column order for the Report Metadata sheet
+METADATA_COLUMNS = (
+    "Page Name",
+    "Visual/Table Name in PBI",
+    "Visual ID",
+    "Visual Type",
+    "UI Field Name",
+    "Usage (Visual/Filter/Slicer)",
+    "Well",
+    "Measure Formula",
+    "Table in the Semantic Model",
+    "Column in the Semantic Model",
+    "Aggregation Function",
+    "Data Type",
+    "Semantic Model Source",
+    "Z Index",
+    "Sort Order",
+)
+
+
 def extract_metadata(report_root: str, model_root: str,
                      include_bookmarks: bool = True,
-                     semantic_model_source: str = "") -> tuple:
+                     semantic_model_source: str = "",
+                     model=None) -> tuple:
     """Main entry point: extract all metadata from a PBIP report.
 
     Args:
@@ -759,6 +802,8 @@ def extract_metadata(report_root: str, model_root: str,
         include_bookmarks: Whether to parse and include bookmark data (default True)
         semantic_model_source: Override for model source ("pbixray", "pbip", etc.)
             If empty, parse_semantic_model() auto-detects from .source marker file.
+        model: Already-parsed SemanticModel for model_root (e.g. from the pipeline).
+            If None, it is parsed here.
 
     Returns:
         Tuple of (metadata_df, bookmarks_list, filter_expressions) where
@@ -772,7 +817,8 @@ def extract_metadata(report_root: str, model_root: str,
 
     # [1] Parse semantic model (measures + columns + source + relationships)
     print(f"\n[1] Parsing semantic model: {model_root}")
-    model = parse_semantic_model(model_root)
+    if model is None:
+        model = parse_semantic_model(model_root)
     # Override source if explicitly provided by caller (e.g. from pipeline)
     if semantic_model_source:
         model.source = semantic_model_source
@@ -857,7 +903,7 @@ def extract_metadata(report_root: str, model_root: str,
     # Mappings for bookmark resolution
     visual_id_to_name = {}      # visual folder name → display label
     page_id_to_name = {}        # page folder name (section ID) → display name
-    page_id_to_visual_ids = {}  # page folder name → set of visual container IDs
+    page_id_to_visual_ids = {}  # page folder name → visual container IDs (dict as ordered set)
 
     for page_folder in sorted(pages_dir.iterdir()):
         if not page_folder.is_dir():
@@ -872,7 +918,7 @@ def extract_metadata(report_root: str, model_root: str,
 
         # Track page ID → name mapping
         page_id_to_name[page_folder.name] = page_name
-        page_id_to_visual_ids[page_folder.name] = set()
+        page_id_to_visual_ids[page_folder.name] = {}
 
         # Page filters
         pf_rows = parse_page_filters(page_json, page_name, measures_lookup,
@@ -906,7 +952,7 @@ def extract_metadata(report_root: str, model_root: str,
             vis_json = json.loads(vis_json_path.read_text(encoding="utf-8-sig"))
 
             # Track visual container ID for bookmark resolution
-            page_id_to_visual_ids[page_folder.name].add(vis_folder.name)
+            page_id_to_visual_ids[page_folder.name][vis_folder.name] = None
 
             vis_rows = parse_visual(vis_json, page_name, measures_lookup, vis_type_counter,
                                     visual_id=vis_folder.name,
@@ -942,24 +988,12 @@ def extract_metadata(report_root: str, model_root: str,
 
         print(f"      Visuals with data: {vis_count}")
 
-    # Build output DataFrame
-    df = pd.DataFrame(all_rows, columns=[
-        "Page Name",
-        "Visual/Table Name in PBI",
-        "Visual ID",
-        "Visual Type",
-        "UI Field Name",
-        "Usage (Visual/Filter/Slicer)",
-        "Well",
-        "Measure Formula",
-        "Table in the Semantic Model",
-        "Column in the Semantic Model",
-        "Aggregation Function",
-        "Data Type",
-        "Semantic Model Source",
-        "Z Index",
-        "Sort Order",
-    ])
+    # Build output DataFrame column-wise — pandas ingests each list directly instead
+    # of inferring a schema from every row dict. Missing keys (e.g. "Sort Order" on
+    # filter rows) become empty cells.
+    df = pd.DataFrame({
+        col: [row.get(col) for row in all_rows] for col in METADATA_COLUMNS
+    })
 
     pseudo_visuals = {'Page Filters', 'Report Filters'}
     data_df = df[~df['Visual/Table Name in PBI'].isin(pseudo_visuals)]
@@ -1001,6 +1035,23 @@ def extract_metadata(report_root: str, model_root: str,
     return df, bookmarks_list, filter_expressions
 
 
+def _autosize_columns(ws, frame: pd.DataFrame):
+    """Set each column's width to its longest value (header included), capped at 60."""
+    header_lens = pd.Series([len(str(c)) for c in frame.columns], index=frame.columns)
+    # Measure cells in place rather than casting the whole frame with astype(str):
+    # metadata columns are already str, and str() on a str returns the same object.
+    # DataFrame.map is pandas 2.1+; applymap is the older spelling
+    cell_map = frame.map if hasattr(frame, "map") else frame.applymap
+    cell_lens = cell_map(lambda value: len(str(value)), na_action="ignore")
+    widths = cell_lens.max().fillna(0).clip(lower=header_lens)
+    widths = (widths + 2).clip(upper=60)
+    for col_idx, width in enumerate(widths.tolist()):
+        if hasattr(ws, "set_column"):
+            ws.set_column(col_idx, col_idx, width)  # xlsxwriter
+        else:
+            ws.column_dimensions[ws.cell(row=1, column=col_idx + 1).column_letter].width = width
+
+
 def export_to_excel(df: pd.DataFrame, output_path: str, bookmarks_list: list = None,
                     filter_expressions: list = None):
     """Save metadata DataFrame to Excel with auto-sized columns.
@@ -1008,16 +1059,19 @@ def export_to_excel(df: pd.DataFrame, output_path: str, bookmarks_list: list = N
     If bookmarks_list is provided, adds a 'Bookmarks' sheet.
     If filter_expressions is provided, adds a 'Filter Expressions' sheet.
     """
-    with pd.ExcelWriter(output_path, engine="openpyxl") as writer:
+    if HAS_XLSXWRITER:
+        # strings_to_urls=False skips xlsxwriter's URL detection on every string cell.
+        # constant_memory is deliberately off: pandas writes cells column by column,
+        # and constant_memory mode (row-at-a-time) would silently drop them.
+        writer = pd.ExcelWriter(output_path, engine="xlsxwriter",
+                                engine_kwargs={"options": {"strings_to_urls": False}})
+    else:
+        writer = pd.ExcelWriter(output_path, engine="openpyxl")
+
+    with writer:
         # --- Report Metadata sheet ---
         df.to_excel(writer, sheet_name="Report Metadata", index=False)
-        ws = writer.sheets["Report Metadata"]
-        for col_idx, col_name in enumerate(df.columns, 1):
-            max_len = max(
-                len(str(col_name)),
-                df[col_name].astype(str).str.len().max() if len(df) > 0 else 0,
-            )
-            ws.column_dimensions[ws.cell(row=1, column=col_idx).column_letter].width = min(max_len + 2, 60)
+        _autosize_columns(writer.sheets["Report Metadata"], df)
 
         # --- Bookmarks sheet ---
         if bookmarks_list:
@@ -1040,13 +1094,7 @@ def export_to_excel(df: pd.DataFrame, output_path: str, bookmarks_list: list = N
                     "Visual Name", "Visible", "Filter DAX",
                 ])
                 bm_df.to_excel(writer, sheet_name="Bookmarks", index=False)
-                ws_bm = writer.sheets["Bookmarks"]
-                for col_idx, col_name in enumerate(bm_df.columns, 1):
-                    max_len = max(
-                        len(str(col_name)),
-                        bm_df[col_name].astype(str).str.len().max() if len(bm_df) > 0 else 0,
-                    )
-                    ws_bm.column_dimensions[ws_bm.cell(row=1, column=col_idx).column_letter].width = min(max_len + 2, 60)
+                _autosize_columns(writer.sheets["Bookmarks"], bm_df)
                 print(f"  Bookmarks sheet: {len(bm_rows)} rows")
 
         # --- Filter Expressions sheet ---
@@ -1056,13 +1104,7 @@ def export_to_excel(df: pd.DataFrame, output_path: str, bookmarks_list: list = N
                 "Filter Level", "Filter Field", "Filter DAX Expression",
             ])
             fe_df.to_excel(writer, sheet_name="Filter Expressions", index=False)
-            ws_fe = writer.sheets["Filter Expressions"]
-            for col_idx, col_name in enumerate(fe_df.columns, 1):
-                max_len = max(
-                    len(str(col_name)),
-                    fe_df[col_name].astype(str).str.len().max() if len(fe_df) > 0 else 0,
-                )
-                ws_fe.column_dimensions[ws_fe.cell(row=1, column=col_idx).column_letter].width = min(max_len + 2, 60)
+            _autosize_columns(writer.sheets["Filter Expressions"], fe_df)
             print(f"  Filter Expressions sheet: {len(filter_expressions)} rows")
 
     print(f"\nExcel file saved to: {output_path}")
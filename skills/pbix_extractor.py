@@ -67,22 +67,26 @@ class PbixExtractResult:
 def read_layout_json(pbix_path: str) -> dict:
     """Read and parse the Report/Layout JSON from a .pbix ZIP.
 
-    The Layout file is UTF-16LE encoded (with BOM).
+    The Layout file is UTF-16LE encoded (with BOM). Only that member is
+    decompressed; the DataModel and static resources are left in the archive.
+    Raises zipfile.BadZipFile if pbix_path is not a ZIP archive.
     """
     with zipfile.ZipFile(pbix_path, "r") as zf:
-        names = zf.namelist()
-        # Find the layout file — typically "Report/Layout" but handle casing
-        layout_name = None
-        for name in names:
-            if name.lower() == "report/layout":
-                layout_name = name
-                break
-        if layout_name is None:
+        # Find the layout file — typically "Report/Layout" (a direct lookup in
+        # the central directory) but handle casing
+        try:
+            layout_info = zf.getinfo("Report/Layout")
+        except KeyError:
+            layout_info = next(
+                (info for info in zf.infolist() if info.filename.lower() == "report/layout"),
+                None,
+            )
+        if layout_info is None:
             raise FileNotFoundError(
                 f"Could not find Report/Layout in {pbix_path}. "
-                f"Available entries: {names[:20]}"
+                f"Available entries: {zf.namelist()[:20]}"
             )
-        raw = zf.read(layout_name)
+        raw = zf.read(layout_info)
 
     # Decode UTF-16LE (handles BOM automatically)
     try:
@@ -1705,8 +1709,14 @@ def extract_pbix(
     pbix_path = str(Path(pbix_path).resolve())
     if not os.path.isfile(pbix_path):
         raise FileNotFoundError(f"PBIX file not found: {pbix_path}")
-    if not zipfile.is_zipfile(pbix_path):
-        raise ValueError(f"Not a valid ZIP/PBIX file: {pbix_path}")
+
+    # Read the monolithic Layout JSON. Opening the archive doubles as the ZIP
+    # check, so the central directory is parsed once rather than again by
+    # zipfile.is_zipfile().
+    try:
+        layout = read_layout_json(pbix_path)
+    except zipfile.BadZipFile:
+        raise ValueError(f"Not a valid ZIP/PBIX file: {pbix_path}") from None
 
     # Derive report name from filename (without extension)
     report_name = Path(pbix_path).stem
@@ -1718,9 +1728,6 @@ def extract_pbix(
 
     logger.info(f"Extracting {pbix_path} → {report_dir}")
 
-    # Read the monolithic Layout JSON
-    layout = read_layout_json(pbix_path)
-
     sections = layout.get("sections", [])
     if not sections:
         logger.warning("No sections (pages) found in Layout JSON")
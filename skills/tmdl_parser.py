@@ -17,6 +17,15 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 
+# Spaces, underscores and hyphens — ignored when fuzzy-matching field names
+_RE_NAME_SEPARATORS = re.compile(r"[\s_\-]+")
+
+
+def _normalize_name(name: str) -> str:
+    """Normalize a field name for fuzzy matching: lowercase, no separators."""
+    return _RE_NAME_SEPARATORS.sub("", name.lower())
+
+
 # ============================================================
 # Data classes
 # ============================================================
@@ -52,6 +61,9 @@ class SemanticModel:
     # Flat indexes for case-insensitive lookup: lowercase name -> list of (table, name)
     _measure_index: dict = field(default_factory=dict)
     _column_index: dict = field(default_factory=dict)
+    # Fuzzy indexes: normalized name (no spaces/underscores/hyphens) -> (table, name)
+    _fuzzy_measure_index: dict = field(default_factory=dict)
+    _fuzzy_column_index: dict = field(default_factory=dict)
     # Model provenance: "pbixray", "pbip", or "" (unknown)
     source: str = ""
     # Relationships between tables
@@ -84,6 +96,15 @@ class SemanticModel:
                 self._column_index[key] = []
             self._column_index[key].append((table, cname))
 
+        # First entry per normalized name wins, matching the old linear-scan order
+        self._fuzzy_measure_index = {}
+        for key, matches in self._measure_index.items():
+            self._fuzzy_measure_index.setdefault(_normalize_name(key), matches[0])
+
+        self._fuzzy_column_index = {}
+        for key, matches in self._column_index.items():
+            self._fuzzy_column_index.setdefault(_normalize_name(key), matches[0])
+
     @property
     def measure_names(self) -> dict:
         """lowercase measure name -> list of (table, measure_name)"""
@@ -465,33 +486,30 @@ def match_field_to_model(field_name: str, model: SemanticModel) -> dict | None:
             "match_type": "column",
         }
 
-    # 3. Fuzzy match — normalize by removing spaces, underscores, hyphens
-    def _normalize(s):
-        return re.sub(r"[\s_\-]+", "", s.lower())
-
-    norm_key = _normalize(field_name)
+    # 3. Fuzzy match — normalized name index (spaces, underscores, hyphens removed)
+    norm_key = _normalize_name(field_name)
 
     # Check measures first
-    for mname_lower, matches in model.measure_names.items():
-        if _normalize(mname_lower) == norm_key:
-            table, mname = matches[0]
-            formula = model.measures.get((table, mname), "")
-            return {
-                "table": table,
-                "field_name": mname,
-                "formula": formula,
-                "match_type": "measure_fuzzy",
-            }
+    fuzzy_measure = model._fuzzy_measure_index.get(norm_key)
+    if fuzzy_measure:
+        table, mname = fuzzy_measure
+        formula = model.measures.get((table, mname), "")
+        return {
+            "table": table,
+            "field_name": mname,
+            "formula": formula,
+            "match_type": "measure_fuzzy",
+        }
 
     # Check columns
-    for cname_lower, matches in model.column_names.items():
-        if _normalize(cname_lower) == norm_key:
-            table, cname = matches[0]
-            return {
-                "table": table,
-                "field_name": cname,
-                "formula": "",
-                "match_type": "column_fuzzy",
-            }
+    fuzzy_column = model._fuzzy_column_index.get(norm_key)
+    if fuzzy_column:
+        table, cname = fuzzy_column
+        return {
+            "table": table,
+            "field_name": cname,
+            "formula": "",
+            "match_type": "column_fuzzy",
+        }
 
     return None
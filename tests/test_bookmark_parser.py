@@ -0,0 +1,35 @@
+# -*- coding: utf-8 -*-
+"""Tests for bookmark filter → DAX conversion."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skills"))
+
+from bookmark_parser import condition_to_dax  # noqa: E402
+
+FROM = [{"Name": "t", "Entity": "T", "Type": 0}]
+
+COMPARISON_A_EQ_1 = {
+    "Comparison": {
+        "ComparisonKind": 0,
+        "Left": {"Column": {"Expression": {"SourceRef": {"Source": "t"}}, "Property": "A"}},
+        "Right": {"Literal": {"Value": "1L"}},
+    }
+}
+UNSUPPORTED = {"SomethingUnknown": {}}
+
+
+def test_and_with_unsupported_operand_is_unsupported():
+    condition = {"And": {"Left": COMPARISON_A_EQ_1, "Right": UNSUPPORTED}}
+    assert condition_to_dax(condition, FROM) is None
+
+
+def test_not_and_with_unsupported_operand_is_not_narrowed():
+    condition = {"Not": {"Expression": {"And": {"Left": COMPARISON_A_EQ_1, "Right": UNSUPPORTED}}}}
+    assert condition_to_dax(condition, FROM) is None
+
+
+def test_supported_and_still_converts():
+    condition = {"And": {"Left": COMPARISON_A_EQ_1, "Right": COMPARISON_A_EQ_1}}
+    assert condition_to_dax(condition, FROM) == "'T'[A] = 1 && 'T'[A] = 1"